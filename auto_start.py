@@ -4,35 +4,129 @@ Auto-start script for Janata Audit Bengaluru
 Automatically runs government data scraper and starts the application
 """
 
+import hashlib
 import subprocess
+import selectors
+import socket
 import sys
 import os
+import shutil
 import time
 import threading
 import webbrowser
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-def run_command(command, cwd=None, shell=True):
-    """Run a command and return the process"""
+def _drain(pipe):
+    """Forward a child's output to our stdout so its pipe never fills up"""
+    with pipe:
+        for line in iter(pipe.readline, ''):
+            sys.stdout.write(line)
+    sys.stdout.flush()
+
+_SEPARATOR = "=" * 50
+
+_BANNER = f"""🚀 Janata Audit Bengaluru - Auto Start
+{_SEPARATOR}
+This will automatically:
+1. Run the government data scraper
+2. Start the backend server
+3. Start the frontend server
+4. Open the application in your browser
+{_SEPARATOR}
+"""
+
+_READY_MESSAGE = f"""
+✅ All services started successfully!
+🌐 Application is available at: http://localhost:3000
+🔧 Backend API is available at: http://localhost:3000/api
+
+📝 Press Ctrl+C to stop all services
+{_SEPARATOR}
+"""
+
+# Resolve tool paths once instead of going through a shell on every spawn
+NPM = shutil.which("npm") or "npm"
+NODE = shutil.which("node") or "node"
+
+# Every child started by run_command (installs and the scraper as well as the
+# servers), so shutdown can stop whichever are still running
+_CHILDREN = []
+_CHILDREN_LOCK = threading.Lock()
+_SHUTTING_DOWN = False
+
+def run_command(argv, cwd=None, capture=False):
+    """Run a command (an argv list, no shell) and return the process
+    
+    By default the child inherits our stdout/stderr. With capture=True its
+    output is piped and drained by a background thread. Returns None once
+    shutdown has started.
+    """
+    command = " ".join(argv)
     try:
-        print(f"🚀 Running: {command}")
-        process = subprocess.Popen(
-            command,
-            cwd=cwd,
-            shell=shell,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True
-        )
+        # Spawning under the lock means stop_children never misses a child
+        with _CHILDREN_LOCK:
+            if _SHUTTING_DOWN:
+                return None
+            print(f"🚀 Running: {command}")
+            if capture:
+                process = subprocess.Popen(
+                    argv,
+                    cwd=cwd,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.STDOUT,
+                    text=True
+                )
+                threading.Thread(target=_drain, args=(process.stdout,), daemon=True).start()
+            else:
+                process = subprocess.Popen(argv, cwd=cwd)
+            _CHILDREN.append(process)
         return process
     except Exception as e:
         print(f"❌ Error running command '{command}': {e}")
         return None
 
+def stop_children():
+    """Stop every child run_command started that is still running, and refuse new ones"""
+    global _SHUTTING_DOWN
+    with _CHILDREN_LOCK:
+        _SHUTTING_DOWN = True
+        children = [process for process in _CHILDREN if process.poll() is None]
+    for process in children:
+        process.terminate()
+    for process in children:
+        try:
+            process.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            process.kill()
+
+DEPS_STAMP = ".deps_stamp"
+
+def _manifest_hash(manifest):
+    """Hash a dependency manifest so unchanged installs can be skipped"""
+    return hashlib.blake2b(manifest.read_bytes(), digest_size=16).hexdigest()
+
+def _needs_install(manifest, stamp, installed_dir=None):
+    """Return True if the manifest changed since the last successful install"""
+    if not manifest.exists():
+        return True
+    if installed_dir is not None and not installed_dir.exists():
+        return True
+    return not (stamp.exists() and stamp.read_text() == _manifest_hash(manifest))
+
+def _mark_installed(manifest, stamp):
+    """Record the manifest hash after a successful install"""
+    if manifest.exists():
+        stamp.write_text(_manifest_hash(manifest))
+
+def _npm_manifest(path):
+    """Prefer the lockfile as the npm install fingerprint"""
+    lockfile = path / "package-lock.json"
+    return lockfile if lockfile.exists() else path / "package.json"
+
 def run_scraper():
     """Run the government data scraper"""
-    print("📊 Starting Government Data Scraper...")
-    print("=" * 50)
+    print(f"📊 Starting Government Data Scraper...\n{_SEPARATOR}")
     
     scraper_path = Path("python_scripts")
     if not scraper_path.exists():
@@ -40,16 +134,27 @@ def run_scraper():
         return False
     
     # Install Python dependencies
-    print("📦 Installing Python dependencies...")
-    install_process = run_command("pip install -r requirements.txt", cwd=scraper_path)
-    if install_process:
-        install_process.wait()
-        if install_process.returncode != 0:
-            print("⚠️  Warning: Some Python dependencies may not have installed correctly")
+    manifest = scraper_path / "requirements.txt"
+    stamp = scraper_path / DEPS_STAMP
+    if _needs_install(manifest, stamp):
+        print("📦 Installing Python dependencies...")
+        install_process = run_command(
+            [sys.executable, "-m", "pip", "install", "-r", "requirements.txt"],
+            cwd=scraper_path,
+            capture=True
+        )
+        if install_process:
+            install_process.wait()
+            if install_process.returncode != 0:
+                print("⚠️  Warning: Some Python dependencies may not have installed correctly")
+            else:
+                _mark_installed(manifest, stamp)
+    else:
+        print("📦 Python dependencies are up to date")
     
     # Run the scraper
     print("🕷️  Running government portal scraper...")
-    scraper_process = run_command("python run_scraper.py", cwd=scraper_path)
+    scraper_process = run_command([sys.executable, "run_scraper.py"], cwd=scraper_path)
     if scraper_process:
         scraper_process.wait()
         if scraper_process.returncode == 0:
@@ -62,26 +167,35 @@ def run_scraper():
     
     return True
 
+def install_backend():
+    """Install backend dependencies"""
+    backend_path = Path("backend")
+    
+    # Install Node.js dependencies
+    manifest = _npm_manifest(backend_path)
+    stamp = backend_path / DEPS_STAMP
+    if _needs_install(manifest, stamp, backend_path / "node_modules"):
+        print("📦 Installing Node.js dependencies...")
+        install_process = run_command([NPM, "install"], cwd=backend_path)
+        if install_process:
+            install_process.wait()
+            if install_process.returncode != 0:
+                print("⚠️  Warning: Some Node.js dependencies may not have installed correctly")
+            else:
+                _mark_installed(manifest, stamp)
+    else:
+        print("📦 Node.js dependencies are up to date")
+    return True
+
 def start_backend():
     """Start the backend server"""
     print("🔧 Starting Backend Server...")
     
     backend_path = Path("backend")
-    if not backend_path.exists():
-        print("❌ Backend directory not found!")
-        return None
-    
-    # Install Node.js dependencies
-    print("📦 Installing Node.js dependencies...")
-    install_process = run_command("npm install", cwd=backend_path)
-    if install_process:
-        install_process.wait()
-        if install_process.returncode != 0:
-            print("⚠️  Warning: Some Node.js dependencies may not have installed correctly")
     
     # Start the backend server
     print("🚀 Starting backend server...")
-    backend_process = run_command("node server.js", cwd=backend_path)
+    backend_process = run_command([NODE, "server.js"], cwd=backend_path)
     if backend_process:
         print("✅ Backend server started!")
         return backend_process
@@ -89,21 +203,31 @@ def start_backend():
         print("❌ Failed to start backend server")
         return None
 
+def install_frontend():
+    """Install frontend dependencies"""
+    frontend_path = Path(".")
+    manifest = _npm_manifest(frontend_path)
+    stamp = frontend_path / DEPS_STAMP
+    if _needs_install(manifest, stamp, frontend_path / "node_modules"):
+        print("📦 Installing frontend dependencies...")
+        install_process = run_command([NPM, "install"])
+        if install_process:
+            install_process.wait()
+            if install_process.returncode != 0:
+                print("⚠️  Warning: Some frontend dependencies may not have installed correctly")
+            else:
+                _mark_installed(manifest, stamp)
+    else:
+        print("📦 Frontend dependencies are up to date")
+    return True
+
 def start_frontend():
     """Start the frontend development server"""
     print("🎨 Starting Frontend Server...")
     
-    # Install Node.js dependencies
-    print("📦 Installing frontend dependencies...")
-    install_process = run_command("npm install")
-    if install_process:
-        install_process.wait()
-        if install_process.returncode != 0:
-            print("⚠️  Warning: Some frontend dependencies may not have installed correctly")
-    
     # Start the frontend server
     print("🚀 Starting frontend server...")
-    frontend_process = run_command("npm start")
+    frontend_process = run_command([NPM, "start"])
     if frontend_process:
         print("✅ Frontend server started!")
         return frontend_process
@@ -111,10 +235,22 @@ def start_frontend():
         print("❌ Failed to start frontend server")
         return None
 
+def wait_for_port(port, timeout=30):
+    """Wait until something is listening on localhost:port"""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=0.1).close()
+            return True
+        except OSError:
+            time.sleep(0.05)
+    return False
+
 def open_browser():
     """Open the application in the browser"""
     print("🌐 Opening application in browser...")
-    time.sleep(5)  # Wait for servers to start
+    if not wait_for_port(3000):
+        print("⚠️  Frontend server is not responding yet")
     try:
         webbrowser.open("http://localhost:3000")
         print("✅ Application opened in browser!")
@@ -122,32 +258,86 @@ def open_browser():
         print(f"⚠️  Could not open browser automatically: {e}")
         print("🌐 Please open http://localhost:3000 in your browser")
 
+def wait_for_exit(processes):
+    """Block until any of the given processes exits and return its name"""
+    # Linux >= 5.3: a pidfd becomes readable when the child exits, so one
+    # selector wait replaces periodic polling of every process.
+    if hasattr(os, "pidfd_open"):
+        selector = selectors.DefaultSelector()
+        pidfds = []
+        try:
+            for name, process in processes:
+                pidfds.append(os.pidfd_open(process.pid))
+                selector.register(pidfds[-1], selectors.EVENT_READ, data=name)
+            while True:
+                for key, _ in selector.select():
+                    return key.data
+        except OSError:
+            # pidfd_open can still be refused (old kernel, seccomp); poll instead
+            pass
+        finally:
+            selector.close()
+            for fd in pidfds:
+                os.close(fd)
+        return _poll_for_exit(processes)
+    
+    # Windows: wait on the process handles. Popen._handle is a private
+    # attribute, so fall back to polling if it is ever missing.
+    handles = None
+    if os.name == 'nt':  # Windows
+        handles = [getattr(process, "_handle", None) for _, process in processes]
+    if handles and None not in handles:
+        import ctypes
+        WAIT_TIMEOUT = 0x102
+        handle_array = (ctypes.c_void_p * len(handles))(*handles)
+        while True:
+            # A finite timeout keeps Ctrl+C (KeyboardInterrupt) responsive
+            index = ctypes.windll.kernel32.WaitForMultipleObjects(
+                len(handles), handle_array, False, 500
+            )
+            if index != WAIT_TIMEOUT:
+                break
+        if 0 <= index < len(processes):
+            return processes[index][0]
+    
+    return _poll_for_exit(processes)
+
+def _poll_for_exit(processes):
+    """Fallback monitor for platforms without pidfd support"""
+    while True:
+        for name, process in processes:
+            if process.poll() is not None:
+                return name
+        time.sleep(1)
+
 def main():
     """Main function to start everything"""
-    print("🚀 Janata Audit Bengaluru - Auto Start")
-    print("=" * 50)
-    print("This will automatically:")
-    print("1. Run the government data scraper")
-    print("2. Start the backend server")
-    print("3. Start the frontend server")
-    print("4. Open the application in your browser")
-    print("=" * 50)
-    
-    # Check if we're in the right directory
-    if not Path("package.json").exists():
+    sys.stdout.write(_BANNER)
+    
+    # Check if we're in the right directory; one directory read covers
+    # every top-level path the startup steps rely on
+    entries = {entry.name for entry in os.scandir(".")}
+    if "package.json" not in entries:
         print("❌ Please run this script from the project root directory")
         return 1
+    if "backend" not in entries:
+        print("❌ Backend directory not found!")
+        return 1
     
     processes = []
+    # The scraper and both dependency installs are independent, so run them
+    # concurrently and start each server as soon as its own install is done.
+    executor = ThreadPoolExecutor(max_workers=3)
     
     try:
-        # Step 1: Run the scraper
+        # Step 1: Run the scraper alongside the dependency installs
         print("\n📊 Step 1: Running Government Data Scraper")
-        scraper_success = run_scraper()
-        if not scraper_success:
-            print("⚠️  Continuing despite scraper issues...")
+        scraper_future = executor.submit(run_scraper)
+        backend_install = executor.submit(install_backend)
+        frontend_install = executor.submit(install_frontend)
         
         # Step 2: Start backend server
+        backend_install.result()
         print("\n🔧 Step 2: Starting Backend Server")
         backend_process = start_backend()
         if backend_process:
@@ -157,6 +347,7 @@ def main():
             return 1
         
         # Step 3: Start frontend server
+        frontend_install.result()
         print("\n🎨 Step 3: Starting Frontend Server")
         frontend_process = start_frontend()
         if frontend_process:
@@ -171,36 +362,35 @@ def main():
         browser_thread.daemon = True
         browser_thread.start()
         
+        if not scraper_future.result():
+            print("⚠️  Continuing despite scraper issues...")
+        
         # Step 5: Keep everything running
-        print("\n✅ All services started successfully!")
-        print("🌐 Application is available at: http://localhost:3000")
-        print("🔧 Backend API is available at: http://localhost:3000/api")
-        print("\n📝 Press Ctrl+C to stop all services")
-        print("=" * 50)
+        sys.stdout.write(_READY_MESSAGE)
+        sys.stdout.flush()
         
         # Monitor processes
-        while True:
-            time.sleep(1)
-            for name, process in processes:
-                if process.poll() is not None:
-                    print(f"❌ {name} server stopped unexpectedly!")
-                    return 1
+        name = wait_for_exit(processes)
+        print(f"❌ {name} server stopped unexpectedly!")
+        return 1
     
     except KeyboardInterrupt:
         print("\n🛑 Shutting down all services...")
-        for name, process in processes:
+        # Drop queued steps; the running ones return once their child is stopped
+        executor.shutdown(wait=False, cancel_futures=True)
+        for name, _ in processes:
             print(f"🛑 Stopping {name} server...")
-            process.terminate()
-            try:
-                process.wait(timeout=5)
-            except subprocess.TimeoutExpired:
-                process.kill()
+        # Also stops installs and the scraper still running on the executor
+        stop_children()
         print("✅ All services stopped!")
         return 0
     
     except Exception as e:
         print(f"❌ Unexpected error: {e}")
         return 1
+    
+    finally:
+        executor.shutdown(wait=False)
 
 if __name__ == "__main__":
     exit_code = main()
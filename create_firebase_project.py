@@ -5,15 +5,36 @@ This script helps create the Firebase project and configure it
 """
 
 import webbrowser
-import time
 import json
 import os
+import sys
+
+_BANNER = f"""🔥{"=" * 60}
+   FIREBASE PROJECT CREATION
+   Janata Audit Bengaluru
+{"=" * 62}
+"""
+
+_COMPLETE_MESSAGE = f"""
+🎉 FIREBASE SETUP COMPLETE!
+{"=" * 30}
+Your project is now connected to Firebase!
+Login info and feedback will be saved to the database.
+
+🚀 Next steps:
+   1. Start your server: python simple_server.py
+   2. Open http://localhost:8009
+   3. Test the login and feedback features
+   4. Check Firebase Console to see your data
+"""
+
+def print_steps(steps):
+    """Print a numbered list of setup steps"""
+    sys.stdout.write("\n".join(f"   {step}" for step in steps) + "\n")
+    sys.stdout.flush()
 
 def print_banner():
-    print("🔥" + "="*60)
-    print("   FIREBASE PROJECT CREATION")
-    print("   Janata Audit Bengaluru")
-    print("="*62)
+    sys.stdout.write(_BANNER)
 
 def create_firebase_project():
     """Create Firebase project and configure it"""
@@ -43,9 +64,7 @@ def create_firebase_project():
         "13. Come back here and press Enter"
     ]
     
-    for i, step in enumerate(steps, 1):
-        print(f"   {step}")
-        time.sleep(0.3)
+    print_steps(steps)
     
     input("\n⏳ Press Enter when you've completed the steps above...")
 
@@ -68,9 +87,7 @@ def configure_authentication():
         "8. Click 'Save'"
     ]
     
-    for step in auth_steps:
-        print(f"   {step}")
-        time.sleep(0.3)
+    print_steps(auth_steps)
     
     input("\n⏳ Press Enter when authentication is configured...")
 
@@ -93,9 +110,7 @@ def configure_firestore():
         "8. Click 'Publish'"
     ]
     
-    for step in firestore_steps:
-        print(f"   {step}")
-        time.sleep(0.3)
+    print_steps(firestore_steps)
     
     print("\n🔒 SECURITY RULES:")
     print("="*20)
@@ -144,9 +159,7 @@ def update_configuration():
         "5. Run the migration script"
     ]
     
-    for step in config_steps:
-        print(f"   {step}")
-        time.sleep(0.3)
+    print_steps(config_steps)
     
     print("\n💡 Your Firebase configuration should look like this:")
     print("="*55)
@@ -184,9 +197,7 @@ def test_connection():
         "7. Submit feedback and check if it's saved"
     ]
     
-    for step in test_steps:
-        print(f"   {step}")
-        time.sleep(0.3)
+    print_steps(test_steps)
     
     print("\n✅ SUCCESS INDICATORS:")
     print("="*22)
@@ -219,15 +230,7 @@ def main():
     # Step 5: Test connection
     test_connection()
     
-    print("\n🎉 FIREBASE SETUP COMPLETE!")
-    print("="*30)
-    print("Your project is now connected to Firebase!")
-    print("Login info and feedback will be saved to the database.")
-    print("\n🚀 Next steps:")
-    print("   1. Start your server: python simple_server.py")
-    print("   2. Open http://localhost:8009")
-    print("   3. Test the login and feedback features")
-    print("   4. Check Firebase Console to see your data")
+    sys.stdout.write(_COMPLETE_MESSAGE)
 
 if __name__ == "__main__":
     main()
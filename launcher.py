@@ -7,8 +7,32 @@ import subprocess
 import sys
 import os
 import json
+import threading
+import urllib.request
 from pathlib import Path
 
+HEALTH_URL = "http://localhost:3000/api/health"
+
+# Shared session so repeated status checks reuse one keep-alive connection.
+# Built on first use: the launcher runs before dependencies are installed,
+# so requests is optional and the standard library is the fallback.
+_SESSION = None
+_SESSION_LOCK = threading.Lock()
+
+def _get_session():
+    """Return the shared requests session, or None if requests is not installed"""
+    global _SESSION
+    with _SESSION_LOCK:
+        if _SESSION is None:
+            try:
+                import requests
+                from requests.adapters import HTTPAdapter
+            except ImportError:
+                return None
+            _SESSION = requests.Session()
+            _SESSION.mount("http://", HTTPAdapter(pool_connections=1, pool_maxsize=1))
+        return _SESSION
+
 def start_application():
     """Start the application and return status"""
     try:
@@ -16,20 +40,20 @@ def start_application():
         if not Path("auto_start.py").exists():
             return {"success": False, "error": "Auto-start script not found"}
         
-        # Start the auto-start script in the background
+        # Start the auto-start script in the background, detached from this
+        # (possibly long-lived, multi-threaded) process. Its output goes to a
+        # log file: pipes nobody reads would block it once they fill up.
         if os.name == 'nt':  # Windows
-            process = subprocess.Popen(
-                ["python", "auto_start.py"],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                creationflags=subprocess.CREATE_NEW_PROCESS_GROUP
-            )
+            detach = {"creationflags": subprocess.CREATE_NEW_PROCESS_GROUP}
         else:  # Unix-like
+            detach = {"start_new_session": True}
+        with open("auto_start.log", "ab") as log:
             process = subprocess.Popen(
-                ["python3", "auto_start.py"],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                preexec_fn=os.setsid
+                [sys.executable, "auto_start.py"],
+                stdin=subprocess.DEVNULL,
+                stdout=log,
+                stderr=subprocess.STDOUT,
+                **detach
             )
         
         return {"success": True, "pid": process.pid, "message": "Application starting..."}
@@ -40,8 +64,11 @@ def start_application():
 def check_status():
     """Check if the application is running"""
     try:
-        import requests
-        response = requests.get("http://localhost:3000/api/health", timeout=5)
+        session = _get_session()
+        if session is None:
+            with urllib.request.urlopen(HEALTH_URL, timeout=5) as response:
+                return {"running": response.status == 200}
+        response = session.get(HEALTH_URL, timeout=5)
         return {"running": response.status_code == 200}
     except:
         return {"running": False}
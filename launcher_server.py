@@ -4,19 +4,79 @@ Simple HTTP server to serve the launcher interface
 """
 
 import http.server
-import socketserver
 import json
-import subprocess
 import os
 from urllib.parse import urlparse, parse_qs
 
+try:
+    import orjson
+    _dumps = orjson.dumps
+except ImportError:
+    def _dumps(obj):
+        return json.dumps(obj).encode()
+
+import launcher
+
+# Fixed parts of every JSON response, pre-encoded once
+_STATUS_LINES = {
+    status: f"HTTP/1.1 {status} {http.server.BaseHTTPRequestHandler.responses[status][0]}\r\n".encode('latin-1')
+    for status in (200, 500)
+}
+_JSON_HEADERS = (
+    b'Content-Type: application/json\r\n'
+    b'Access-Control-Allow-Origin: *\r\n'
+)
+
 class LauncherHandler(http.server.SimpleHTTPRequestHandler):
+    # Keep-alive requires every response to carry Content-Length
+    protocol_version = 'HTTP/1.1'
+    
+    def _send_body(self, status, body):
+        """Send a pre-serialized JSON body as a single write"""
+        self.log_request(status)
+        self.wfile.write(b''.join((
+            _STATUS_LINES[status],
+            _JSON_HEADERS,
+            b'Content-Length: %d\r\n\r\n' % len(body),
+            body
+        )))
+    
+    def _send_json(self, status, obj):
+        """Serialize obj and send it as a JSON response"""
+        self._send_body(status, _dumps(obj))
+    
+    def copyfile(self, source, outputfile):
+        """Send static files with os.sendfile where the platform supports it"""
+        if not hasattr(os, 'sendfile'):
+            return super().copyfile(source, outputfile)
+        try:
+            in_fd = source.fileno()
+            out_fd = outputfile.fileno()
+        except (AttributeError, OSError):
+            return super().copyfile(source, outputfile)
+        
+        offset = 0
+        try:
+            while True:
+                sent = os.sendfile(out_fd, in_fd, offset, 1 << 20)
+                if sent == 0:
+                    break
+                offset += sent
+        except OSError:
+            if offset:
+                raise
+            # Unsupported source/socket combination; use the buffered copy
+            super().copyfile(source, outputfile)
+    
     def do_GET(self):
         if self.path == '/':
             self.path = '/index.html'
         return super().do_GET()
     
     def do_POST(self):
+        # Drain any request body so the kept-alive connection stays in sync
+        self.rfile.read(int(self.headers.get('Content-Length', 0)))
+        
         if self.path == '/api/start':
             self.handle_start()
         elif self.path == '/api/status':
@@ -28,58 +88,22 @@ class LauncherHandler(http.server.SimpleHTTPRequestHandler):
         """Handle application start request"""
         try:
             # Start the application
-            result = subprocess.run(
-                ["python", "launcher.py", "start"],
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
+            response_data = launcher.start_application()
             
-            if result.returncode == 0:
-                response_data = json.loads(result.stdout)
-            else:
-                response_data = {"success": False, "error": result.stderr}
-            
-            self.send_response(200)
-            self.send_header('Content-type', 'application/json')
-            self.send_header('Access-Control-Allow-Origin', '*')
-            self.end_headers()
-            self.wfile.write(json.dumps(response_data).encode())
+            self._send_json(200, response_data)
             
         except Exception as e:
-            self.send_response(500)
-            self.send_header('Content-type', 'application/json')
-            self.send_header('Access-Control-Allow-Origin', '*')
-            self.end_headers()
-            self.wfile.write(json.dumps({"success": False, "error": str(e)}).encode())
+            self._send_json(500, {"success": False, "error": str(e)})
     
     def handle_status(self):
         """Handle status check request"""
         try:
-            result = subprocess.run(
-                ["python", "launcher.py", "status"],
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
-            
-            if result.returncode == 0:
-                response_data = json.loads(result.stdout)
-            else:
-                response_data = {"running": False}
+            response_data = launcher.check_status()
             
-            self.send_response(200)
-            self.send_header('Content-type', 'application/json')
-            self.send_header('Access-Control-Allow-Origin', '*')
-            self.end_headers()
-            self.wfile.write(json.dumps(response_data).encode())
+            self._send_json(200, response_data)
             
         except Exception as e:
-            self.send_response(500)
-            self.send_header('Content-type', 'application/json')
-            self.send_header('Access-Control-Allow-Origin', '*')
-            self.end_headers()
-            self.wfile.write(json.dumps({"running": False, "error": str(e)}).encode())
+            self._send_json(500, {"running": False, "error": str(e)})
 
 def main():
     PORT = 8080
@@ -88,7 +112,7 @@ def main():
     print(f"🌐 Open http://localhost:{PORT} in your browser")
     print("📝 Press Ctrl+C to stop")
     
-    with socketserver.TCPServer(("", PORT), LauncherHandler) as httpd:
+    with http.server.ThreadingHTTPServer(("", PORT), LauncherHandler) as httpd:
         try:
             httpd.serve_forever()
         except KeyboardInterrupt:
@@ -4,21 +4,171 @@ Simple HTTP server to serve project data
 """
 
 import http.server
-import socketserver
 import json
 import os
+import subprocess
+import sys
+import threading
+import time
+import uuid
 from urllib.parse import urlparse, parse_qs
 
+try:
+    import orjson
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(obj):
+        return json.dumps(obj).encode()
+    def _loads(data):
+        return json.loads(bytes(data))
+
+# Fixed parts of every JSON response, pre-encoded once
+_STATUS_LINES = {
+    status: f"HTTP/1.1 {status} {http.server.BaseHTTPRequestHandler.responses[status][0]}\r\n".encode('latin-1')
+    for status in (200, 500)
+}
+_JSON_HEADERS = (
+    b'Content-Type: application/json\r\n'
+    b'Access-Control-Allow-Origin: *\r\n'
+)
+
+PROJECTS_FILE = 'real_projects.json'
+
+def _load_json_file(path):
+    """Parse a JSON file in a single read"""
+    # Not mmapped: the scrape job rewrites the file in place, and touching
+    # mapped pages past a concurrent truncation kills the process with SIGBUS
+    with open(path, 'rb') as f:
+        return _loads(f.read())
+
+
+SCRAPE_TIMEOUT = 300
+
+# Finished jobs stay queryable this long (seconds) before they are pruned
+JOB_RETENTION = 3600
+
+# Background scrape jobs keyed by job id; each entry is updated by its watcher thread
+_JOBS = {}
+# time.monotonic() at which each finished job completed
+_JOBS_FINISHED = {}
+_JOBS_LOCK = threading.Lock()
+
+def _prune_finished_jobs():
+    """Drop jobs that finished more than JOB_RETENTION seconds ago; call with _JOBS_LOCK held"""
+    cutoff = time.monotonic() - JOB_RETENTION
+    for job_id in [job_id for job_id, finished in _JOBS_FINISHED.items() if finished < cutoff]:
+        del _JOBS_FINISHED[job_id]
+        _JOBS.pop(job_id, None)
+
+def _scrape_job_result(process):
+    """Wait for a scrape process to finish and describe its outcome"""
+    try:
+        _, stderr = process.communicate(timeout=SCRAPE_TIMEOUT)
+    except subprocess.TimeoutExpired:
+        process.kill()
+        process.communicate()
+        return {
+            'status': 'failed',
+            'success': False,
+            'error': 'Scraper timed out after 5 minutes'
+        }
+    
+    if process.returncode != 0:
+        return {
+            'status': 'failed',
+            'success': False,
+            'error': f'Scraper failed: {stderr}'
+        }
+    if not os.path.exists(PROJECTS_FILE):
+        return {
+            'status': 'failed',
+            'success': False,
+            'error': 'Scraper completed but no projects file was created'
+        }
+    # Check if real_projects.json was created
+    projects = _load_json_file(PROJECTS_FILE)
+    return {
+        'status': 'done',
+        'success': True,
+        'count': len(projects),
+        'message': f'Successfully scraped {len(projects)} projects'
+    }
+
+def _watch_scrape_job(job_id, process):
+    """Record a scrape job's outcome; the job always ends as 'done' or 'failed'"""
+    try:
+        result = _scrape_job_result(process)
+    except Exception as e:
+        if process.poll() is None:
+            process.kill()
+        result = {
+            'status': 'failed',
+            'success': False,
+            'error': f'Error running scraper: {str(e)}'
+        }
+    
+    with _JOBS_LOCK:
+        _JOBS[job_id].update(result)
+        _JOBS_FINISHED[job_id] = time.monotonic()
+        _prune_finished_jobs()
+
 class ProjectsHandler(http.server.SimpleHTTPRequestHandler):
+    # Keep-alive requires every response to carry Content-Length
+    protocol_version = 'HTTP/1.1'
+    
+    # Serialized /api/projects body for PROJECTS_FILE, rebuilt when its mtime changes
+    _cache_bytes = None
+    _cache_mtime = None
+    _cache_lock = threading.Lock()
+    
+    @classmethod
+    def _load_projects_body(cls):
+        """Return the cached response body for real projects, or None if absent"""
+        try:
+            mtime = os.stat(PROJECTS_FILE).st_mtime
+        except FileNotFoundError:
+            return None
+        
+        with cls._cache_lock:
+            if mtime != cls._cache_mtime:
+                projects = _load_json_file(PROJECTS_FILE)
+                cls._cache_bytes = _dumps({
+                    'success': True,
+                    'projects': projects,
+                    'total': len(projects)
+                })
+                cls._cache_mtime = mtime
+            return cls._cache_bytes
+    
+    def _send_body(self, status, body):
+        """Send a pre-serialized JSON body as a single write"""
+        self.log_request(status)
+        self.wfile.write(b''.join((
+            _STATUS_LINES[status],
+            _JSON_HEADERS,
+            b'Content-Length: %d\r\n\r\n' % len(body),
+            body
+        )))
+    
+    def _send_json(self, status, obj):
+        """Serialize obj and send it as a JSON response"""
+        self._send_body(status, _dumps(obj))
+    
     def do_GET(self):
         if self.path == '/api/projects':
             self.handle_projects_api()
         elif self.path == '/api/health':
             self.handle_health_api()
+        elif self.path.startswith('/api/scrape/status/'):
+            self.handle_scrape_status_api(self.path.rsplit('/', 1)[-1])
         else:
             super().do_GET()
     
     def do_POST(self):
+        # Drain any request body so the kept-alive connection stays in sync
+        self.rfile.read(int(self.headers.get('Content-Length', 0)))
+        
         if self.path == '/api/scrape':
             self.handle_scrape_api()
         else:
@@ -28,24 +178,12 @@ class ProjectsHandler(http.server.SimpleHTTPRequestHandler):
         """Handle /api/projects endpoint"""
         try:
             # Try to load real projects first
-            if os.path.exists('real_projects.json'):
-                with open('real_projects.json', 'r', encoding='utf-8') as f:
-                    projects = json.load(f)
-            else:
+            body = self._load_projects_body()
+            if body is None:
                 # Fallback to mock data
-                projects = get_mock_projects()
-            
-            response_data = {
-                'success': True,
-                'projects': projects,
-                'total': len(projects)
-            }
+                body = _MOCK_RESPONSE_BYTES
             
-            self.send_response(200)
-            self.send_header('Content-type', 'application/json')
-            self.send_header('Access-Control-Allow-Origin', '*')
-            self.end_headers()
-            self.wfile.write(json.dumps(response_data).encode())
+            self._send_body(200, body)
             
         except Exception as e:
             self.send_error(500, f"Error loading projects: {str(e)}")
@@ -57,178 +195,162 @@ class ProjectsHandler(http.server.SimpleHTTPRequestHandler):
             'message': 'Projects server is running'
         }
         
-        self.send_response(200)
-        self.send_header('Content-type', 'application/json')
-        self.send_header('Access-Control-Allow-Origin', '*')
-        self.end_headers()
-        self.wfile.write(json.dumps(response_data).encode())
+        self._send_json(200, response_data)
     
     def handle_scrape_api(self):
-        """Handle /api/scrape endpoint"""
+        """Handle /api/scrape endpoint by starting the scraper in the background"""
         try:
-            import subprocess
-            import sys
-            
             # Run the real project scraper
-            result = subprocess.run([
-                sys.executable, 'python_scripts/real_project_scraper.py'
-            ], capture_output=True, text=True, timeout=300)
-            
-            if result.returncode == 0:
-                # Check if real_projects.json was created
-                if os.path.exists('real_projects.json'):
-                    with open('real_projects.json', 'r', encoding='utf-8') as f:
-                        projects = json.load(f)
-                    
-                    response_data = {
-                        'success': True,
-                        'count': len(projects),
-                        'message': f'Successfully scraped {len(projects)} projects'
-                    }
-                else:
-                    response_data = {
-                        'success': False,
-                        'error': 'Scraper completed but no projects file was created'
-                    }
-            else:
-                response_data = {
-                    'success': False,
-                    'error': f'Scraper failed: {result.stderr}'
-                }
+            process = subprocess.Popen(
+                [sys.executable, 'python_scripts/real_project_scraper.py'],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+                text=True
+            )
+            job_id = uuid.uuid4().hex
+            with _JOBS_LOCK:
+                _prune_finished_jobs()
+                _JOBS[job_id] = {'status': 'running'}
+            threading.Thread(
+                target=_watch_scrape_job, args=(job_id, process), daemon=True
+            ).start()
             
-            self.send_response(200)
-            self.send_header('Content-type', 'application/json')
-            self.send_header('Access-Control-Allow-Origin', '*')
-            self.end_headers()
-            self.wfile.write(json.dumps(response_data).encode())
-            
-        except subprocess.TimeoutExpired:
             response_data = {
-                'success': False,
-                'error': 'Scraper timed out after 5 minutes'
+                'success': True,
+                'job_id': job_id,
+                'status': 'running'
             }
-            self.send_response(200)
-            self.send_header('Content-type', 'application/json')
-            self.send_header('Access-Control-Allow-Origin', '*')
-            self.end_headers()
-            self.wfile.write(json.dumps(response_data).encode())
         except Exception as e:
             response_data = {
                 'success': False,
                 'error': f'Error running scraper: {str(e)}'
             }
-            self.send_response(200)
-            self.send_header('Content-type', 'application/json')
-            self.send_header('Access-Control-Allow-Origin', '*')
-            self.end_headers()
-            self.wfile.write(json.dumps(response_data).encode())
-
-def get_mock_projects():
-    """Get mock projects data"""
-    return [
-        {
-            'id': '1',
-            'projectName': 'BBMP Road Infrastructure Development',
-            'description': 'Comprehensive road development project in Ward 15',
-            'status': 'In Progress',
-            'budget': 50000000,
-            'location': 'Bengaluru, Karnataka',
-            'department': 'BBMP',
-            'wardNumber': 15,
-            'geoPoint': {'latitude': 12.9716, 'longitude': 77.5946},
-            'contractor': 'ABC Construction Ltd.',
-            'startDate': '2023-01-15',
-            'endDate': '2024-12-31',
-            'source': 'BBMP',
-            'sourceUrl': 'https://bbmp.gov.in/',
-            'scrapedAt': '2023-12-01T10:30:00Z'
-        },
-        {
-            'id': '2',
-            'projectName': 'BDA Housing Scheme Phase 2',
-            'description': 'Affordable housing project for middle-income families',
-            'status': 'Completed',
-            'budget': 75000000,
-            'location': 'Bengaluru, Karnataka',
-            'department': 'BDA',
-            'wardNumber': 8,
-            'geoPoint': {'latitude': 12.9352, 'longitude': 77.6245},
-            'contractor': 'XYZ Builders',
-            'startDate': '2022-06-01',
-            'endDate': '2023-11-30',
-            'source': 'BDA',
-            'sourceUrl': 'https://bdabangalore.org/',
-            'scrapedAt': '2023-12-01T10:30:00Z'
-        },
-        {
-            'id': '3',
-            'projectName': 'BWSSB Water Supply Network',
-            'description': 'New water supply network for expanding areas',
-            'status': 'Pending',
-            'budget': 30000000,
-            'location': 'Bengaluru, Karnataka',
-            'department': 'BWSSB',
-            'wardNumber': 22,
-            'geoPoint': {'latitude': 12.9141, 'longitude': 77.6781},
-            'contractor': 'Water Works Ltd.',
-            'startDate': '2024-01-01',
-            'endDate': '2024-12-31',
-            'source': 'BWSSB',
-            'sourceUrl': 'https://bwssb.karnataka.gov.in/',
-            'scrapedAt': '2023-12-01T10:30:00Z'
-        },
-        {
-            'id': '4',
-            'projectName': 'BMRCL Metro Line Extension',
-            'description': 'Extension of metro line to new areas',
-            'status': 'In Progress',
-            'budget': 120000000,
-            'location': 'Bengaluru, Karnataka',
-            'department': 'BMRCL',
-            'wardNumber': 12,
-            'geoPoint': {'latitude': 12.9858, 'longitude': 77.6101},
-            'contractor': 'Metro Construction Co.',
-            'startDate': '2023-03-01',
-            'endDate': '2025-06-30',
-            'source': 'BMRCL',
-            'sourceUrl': 'https://english.bmrc.co.in/',
-            'scrapedAt': '2023-12-01T10:30:00Z'
-        },
-        {
-            'id': '5',
-            'projectName': 'BESCOM Electrical Infrastructure',
-            'description': 'Upgradation of electrical infrastructure',
-            'status': 'In Progress',
-            'budget': 40000000,
-            'location': 'Bengaluru, Karnataka',
-            'department': 'BESCOM',
-            'wardNumber': 18,
-            'geoPoint': {'latitude': 12.9230, 'longitude': 77.5933},
-            'contractor': 'Power Solutions Inc.',
-            'startDate': '2023-08-01',
-            'endDate': '2024-08-31',
-            'source': 'BESCOM',
-            'sourceUrl': 'https://bescom.karnataka.gov.in/',
-            'scrapedAt': '2023-12-01T10:30:00Z'
-        },
-        {
-            'id': '6',
-            'projectName': 'KPWD Bridge Construction',
-            'description': 'New bridge construction over river',
-            'status': 'Pending',
-            'budget': 60000000,
-            'location': 'Bengaluru, Karnataka',
-            'department': 'KPWD',
-            'wardNumber': 25,
-            'geoPoint': {'latitude': 12.9569, 'longitude': 77.7011},
-            'contractor': 'Bridge Builders Ltd.',
-            'startDate': '2024-02-01',
-            'endDate': '2025-01-31',
-            'source': 'KPWD',
-            'sourceUrl': 'https://kpwd.karnataka.gov.in/',
-            'scrapedAt': '2023-12-01T10:30:00Z'
-        }
-    ]
+        
+        self._send_json(200, response_data)
+    
+    def handle_scrape_status_api(self, job_id):
+        """Handle /api/scrape/status/<job_id> endpoint"""
+        with _JOBS_LOCK:
+            job = _JOBS.get(job_id)
+            response_data = dict(job) if job is not None else None
+        
+        if response_data is None:
+            self.send_error(404, "Unknown scrape job")
+            return
+        
+        self._send_json(200, response_data)
+
+# Mock projects served when real_projects.json is absent
+_MOCK_PROJECTS = [
+    {
+        'id': '1',
+        'projectName': 'BBMP Road Infrastructure Development',
+        'description': 'Comprehensive road development project in Ward 15',
+        'status': 'In Progress',
+        'budget': 50000000,
+        'location': 'Bengaluru, Karnataka',
+        'department': 'BBMP',
+        'wardNumber': 15,
+        'geoPoint': {'latitude': 12.9716, 'longitude': 77.5946},
+        'contractor': 'ABC Construction Ltd.',
+        'startDate': '2023-01-15',
+        'endDate': '2024-12-31',
+        'source': 'BBMP',
+        'sourceUrl': 'https://bbmp.gov.in/',
+        'scrapedAt': '2023-12-01T10:30:00Z'
+    },
+    {
+        'id': '2',
+        'projectName': 'BDA Housing Scheme Phase 2',
+        'description': 'Affordable housing project for middle-income families',
+        'status': 'Completed',
+        'budget': 75000000,
+        'location': 'Bengaluru, Karnataka',
+        'department': 'BDA',
+        'wardNumber': 8,
+        'geoPoint': {'latitude': 12.9352, 'longitude': 77.6245},
+        'contractor': 'XYZ Builders',
+        'startDate': '2022-06-01',
+        'endDate': '2023-11-30',
+        'source': 'BDA',
+        'sourceUrl': 'https://bdabangalore.org/',
+        'scrapedAt': '2023-12-01T10:30:00Z'
+    },
+    {
+        'id': '3',
+        'projectName': 'BWSSB Water Supply Network',
+        'description': 'New water supply network for expanding areas',
+        'status': 'Pending',
+        'budget': 30000000,
+        'location': 'Bengaluru, Karnataka',
+        'department': 'BWSSB',
+        'wardNumber': 22,
+        'geoPoint': {'latitude': 12.9141, 'longitude': 77.6781},
+        'contractor': 'Water Works Ltd.',
+        'startDate': '2024-01-01',
+        'endDate': '2024-12-31',
+        'source': 'BWSSB',
+        'sourceUrl': 'https://bwssb.karnataka.gov.in/',
+        'scrapedAt': '2023-12-01T10:30:00Z'
+    },
+    {
+        'id': '4',
+        'projectName': 'BMRCL Metro Line Extension',
+        'description': 'Extension of metro line to new areas',
+        'status': 'In Progress',
+        'budget': 120000000,
+        'location': 'Bengaluru, Karnataka',
+        'department': 'BMRCL',
+        'wardNumber': 12,
+        'geoPoint': {'latitude': 12.9858, 'longitude': 77.6101},
+        'contractor': 'Metro Construction Co.',
+        'startDate': '2023-03-01',
+        'endDate': '2025-06-30',
+        'source': 'BMRCL',
+        'sourceUrl': 'https://english.bmrc.co.in/',
+        'scrapedAt': '2023-12-01T10:30:00Z'
+    },
+    {
+        'id': '5',
+        'projectName': 'BESCOM Electrical Infrastructure',
+        'description': 'Upgradation of electrical infrastructure',
+        'status': 'In Progress',
+        'budget': 40000000,
+        'location': 'Bengaluru, Karnataka',
+        'department': 'BESCOM',
+        'wardNumber': 18,
+        'geoPoint': {'latitude': 12.9230, 'longitude': 77.5933},
+        'contractor': 'Power Solutions Inc.',
+        'startDate': '2023-08-01',
+        'endDate': '2024-08-31',
+        'source': 'BESCOM',
+        'sourceUrl': 'https://bescom.karnataka.gov.in/',
+        'scrapedAt': '2023-12-01T10:30:00Z'
+    },
+    {
+        'id': '6',
+        'projectName': 'KPWD Bridge Construction',
+        'description': 'New bridge construction over river',
+        'status': 'Pending',
+        'budget': 60000000,
+        'location': 'Bengaluru, Karnataka',
+        'department': 'KPWD',
+        'wardNumber': 25,
+        'geoPoint': {'latitude': 12.9569, 'longitude': 77.7011},
+        'contractor': 'Bridge Builders Ltd.',
+        'startDate': '2024-02-01',
+        'endDate': '2025-01-31',
+        'source': 'KPWD',
+        'sourceUrl': 'https://kpwd.karnataka.gov.in/',
+        'scrapedAt': '2023-12-01T10:30:00Z'
+    }
+]
+
+_MOCK_RESPONSE_BYTES = _dumps({
+    'success': True,
+    'projects': _MOCK_PROJECTS,
+    'total': len(_MOCK_PROJECTS)
+})
 
 def main():
     PORT = 3001
@@ -237,7 +359,7 @@ def main():
     print(f"🌐 API available at: http://localhost:{PORT}/api/projects")
     print(f"📝 Press Ctrl+C to stop")
     
-    with socketserver.TCPServer(("", PORT), ProjectsHandler) as httpd:
+    with http.server.ThreadingHTTPServer(("", PORT), ProjectsHandler) as httpd:
         try:
             httpd.serve_forever()
         except KeyboardInterrupt:
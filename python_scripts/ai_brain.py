@@ -6,23 +6,47 @@ Detects anomalies and generates red flags
 
 import sys
 import os
+import re
+import time
 import logging
-from datetime import datetime, timedelta
-from typing import List, Dict, Any, Tuple
+from datetime import datetime, timedelta, timezone
+from typing import List, Dict, Any, Optional, Tuple
 import pandas as pd
 import numpy as np
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 
 # Add the current directory to Python path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from firebase_config import get_firestore_client
 
+# Fetched data is reused by find_suspicious_connections for this many seconds
+SNAPSHOT_MAX_AGE = 300
+
+# Firestore rejects write batches with more than 500 operations
+FIRESTORE_BATCH_LIMIT = 500
+FIRESTORE_WRITE_WORKERS = 8
+
+# First number in a cleaned budget string
+_BUDGET_NUMBER_RE = re.compile(r'([\d.]+)')
+# Single-character symbols removed before parsing a budget
+_BUDGET_STRIP_CHARS = str.maketrans('', '', ',₹')
+
 class AIBrain:
     """AI system for detecting anomalies in civic projects and donations"""
     
+    # Only the fields the detectors read are fetched from Firestore
+    PROJECT_FIELDS = [
+        'budget', 'department', 'startDate', 'endDate',
+        'actualCompletionDate', 'contractorName', 'projectName'
+    ]
+    DONATION_FIELDS = ['politicalPartyName', 'amount']
+    
     def __init__(self):
         self.db = get_firestore_client()
+        self._snapshot = None
+        self._snapshot_time = 0.0
         self.setup_logging()
     
     def setup_logging(self):
@@ -37,20 +61,41 @@ class AIBrain:
         )
         self.logger = logging.getLogger(__name__)
     
+    def _stream_to_dataframe(self, query, fields: List[str]) -> pd.DataFrame:
+        """Stream query documents into a DataFrame built column by column"""
+        columns = {field: [] for field in fields}
+        ids = []
+        
+        for doc in query.stream():
+            data = doc.to_dict()
+            ids.append(doc.id)
+            for field in fields:
+                columns[field].append(data.get(field))
+        
+        columns['id'] = ids
+        return pd.DataFrame(columns)
+    
+    def _query_projects(self) -> pd.DataFrame:
+        """Fetch projects data from Firestore, raising on failure"""
+        projects_ref = self.db.collection('projects').select(self.PROJECT_FIELDS)
+        projects_df = self._stream_to_dataframe(projects_ref, self.PROJECT_FIELDS)
+        
+        # Low-cardinality keys as categories so grouping works on integer codes
+        return projects_df.astype({'department': 'category', 'contractorName': 'category'})
+    
+    def _query_donations(self) -> pd.DataFrame:
+        """Fetch donations data from Firestore, raising on failure"""
+        donations_ref = self.db.collection('politicalDonations').select(self.DONATION_FIELDS)
+        donations_df = self._stream_to_dataframe(donations_ref, self.DONATION_FIELDS)
+        
+        donations_df['politicalPartyName'] = donations_df['politicalPartyName'].astype('category')
+        donations_df['amount'] = pd.to_numeric(donations_df['amount'], errors='coerce')
+        return donations_df
+    
     def fetch_projects_data(self) -> pd.DataFrame:
         """Fetch projects data from Firestore"""
         try:
-            projects_ref = self.db.collection('projects')
-            projects_docs = projects_ref.get()
-            
-            projects_data = []
-            for doc in projects_docs:
-                project_data = doc.to_dict()
-                project_data['id'] = doc.id
-                projects_data.append(project_data)
-            
-            return pd.DataFrame(projects_data)
-            
+            return self._query_projects()
         except Exception as e:
             self.logger.error(f"Error fetching projects data: {str(e)}")
             return pd.DataFrame()
@@ -58,22 +103,58 @@ class AIBrain:
     def fetch_donations_data(self) -> pd.DataFrame:
         """Fetch donations data from Firestore"""
         try:
-            donations_ref = self.db.collection('politicalDonations')
-            donations_docs = donations_ref.get()
-            
-            donations_data = []
-            for doc in donations_docs:
-                donation_data = doc.to_dict()
-                donation_data['id'] = doc.id
-                donations_data.append(donation_data)
-            
-            return pd.DataFrame(donations_data)
-            
+            return self._query_donations()
         except Exception as e:
             self.logger.error(f"Error fetching donations data: {str(e)}")
             return pd.DataFrame()
     
-    def detect_budget_anomalies(self, projects_df: pd.DataFrame) -> List[Dict[str, Any]]:
+    def load_data(self, max_age: float = SNAPSHOT_MAX_AGE) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """Return (projects_df, donations_df), reusing a recent successful fetch"""
+        now = time.monotonic()
+        if self._snapshot is not None and now - self._snapshot_time <= max_age:
+            return self._snapshot
+        
+        # The two collections are independent; fetch them concurrently
+        snapshot = []
+        failed = False
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = [
+                ('projects', executor.submit(self._query_projects)),
+                ('donations', executor.submit(self._query_donations))
+            ]
+            for name, future in futures:
+                try:
+                    snapshot.append(future.result())
+                except Exception as e:
+                    self.logger.error(f"Error fetching {name} data: {str(e)}")
+                    snapshot.append(pd.DataFrame())
+                    failed = True
+        
+        # A failed fetch is not cached, so the next call retries Firestore
+        if failed:
+            return tuple(snapshot)
+        self._snapshot = tuple(snapshot)
+        self._snapshot_time = now
+        return self._snapshot
+    
+    def prepare_projects_data(self, projects_df: pd.DataFrame) -> pd.DataFrame:
+        """Return a copy of projects_df with the derived columns the detectors share"""
+        if projects_df.empty or 'budget_numeric' in projects_df.columns:
+            return projects_df
+        
+        # Scrapers store ISO 8601 strings (or Firestore timestamps); naming the
+        # format avoids pandas' per-element dateutil fallback
+        def to_datetime(column):
+            return pd.to_datetime(projects_df[column], format='ISO8601', errors='coerce', cache=True)
+        
+        return projects_df.assign(
+            budget_numeric=self.extract_budget_numeric_series(projects_df['budget']),
+            start_date=to_datetime('startDate'),
+            end_date=to_datetime('endDate'),
+            actual_end_date=to_datetime('actualCompletionDate')
+        )
+    
+    def detect_budget_anomalies(self, projects_df: pd.DataFrame, detected_at: Optional[datetime] = None) -> List[Dict[str, Any]]:
         """Detect budget-related anomalies"""
         anomalies = []
         
@@ -82,45 +163,61 @@ class AIBrain:
         
         try:
             # Convert budget to numeric
-            projects_df['budget_numeric'] = projects_df['budget'].apply(self.extract_budget_numeric)
+            projects_df = self.prepare_projects_data(projects_df)
             
-            # Filter out zero budgets
-            valid_budgets = projects_df[projects_df['budget_numeric'] > 0]
+            # Filter out zero budgets and projects without a department
+            budget = projects_df['budget_numeric'].to_numpy()
+            valid = (budget > 0) & projects_df['department'].notna().to_numpy()
             
-            if len(valid_budgets) < 2:
+            if np.count_nonzero(valid) < 2:
                 return anomalies
             
-            # Calculate budget statistics by department
-            dept_stats = valid_budgets.groupby('department')['budget_numeric'].agg(['mean', 'std', 'count'])
-            
-            for dept, stats in dept_stats.iterrows():
-                if stats['count'] < 3:  # Need at least 3 projects for meaningful stats
-                    continue
-                
-                # Find outliers (budget > mean + 2*std)
-                threshold = stats['mean'] + 2 * stats['std']
-                outliers = valid_budgets[
-                    (valid_budgets['department'] == dept) & 
-                    (valid_budgets['budget_numeric'] > threshold)
-                ]
-                
-                for _, project in outliers.iterrows():
-                    anomaly = {
-                        'description': f"Unusually high budget for {dept} project: ₹{project['budget_numeric']:,.0f} (avg: ₹{stats['mean']:,.0f})",
-                        'flagType': 'budget_anomaly',
-                        'linkedProjectIds': [project['id']],
-                        'linkedDonationIds': [],
-                        'severity': 'high' if project['budget_numeric'] > stats['mean'] + 3 * stats['std'] else 'medium',
-                        'detectedAt': datetime.now()
-                    }
-                    anomalies.append(anomaly)
+            # Department statistics in one grouped pass over sorted department
+            # codes. Factorizing only the kept rows means every code has a row
+            # in dept_stats, so stats can be looked up by code position.
+            codes, departments = pd.factorize(projects_df['department'][valid], sort=True)
+            budget = budget[valid]
+            dept_stats = pd.Series(budget).groupby(codes).agg(['mean', 'std', 'count'])
+            
+            # Broadcast each department's stats to its rows and build every
+            # mask from the same arrays
+            dept_mean = dept_stats['mean'].to_numpy()[codes]
+            dept_std = dept_stats['std'].to_numpy()[codes]
+            dept_count = dept_stats['count'].to_numpy()[codes]
+            
+            # Find outliers (budget > mean + 2*std); need at least 3 projects
+            # per department for meaningful stats
+            excess = budget - dept_mean
+            outlier_rows = np.flatnonzero((dept_count >= 3) & (excess > 2 * dept_std))
+            outlier_rows = outlier_rows[np.argsort(codes[outlier_rows], kind='stable')]
+            high_severity = excess[outlier_rows] > 3 * dept_std[outlier_rows]
+            project_ids = projects_df['id'].to_numpy()[valid]
+            
+            detected_at = detected_at or datetime.now(timezone.utc)
+            anomalies.extend(
+                {
+                    'description': f"Unusually high budget for {dept} project: ₹{amount:,.0f} (avg: ₹{mean:,.0f})",
+                    'flagType': 'budget_anomaly',
+                    'linkedProjectIds': [project_id],
+                    'linkedDonationIds': [],
+                    'severity': 'high' if is_high else 'medium',
+                    'detectedAt': detected_at
+                }
+                for dept, amount, project_id, mean, is_high in zip(
+                    departments[codes[outlier_rows]].tolist(),
+                    budget[outlier_rows].tolist(),
+                    project_ids[outlier_rows].tolist(),
+                    dept_mean[outlier_rows].tolist(),
+                    high_severity.tolist()
+                )
+            )
             
         except Exception as e:
             self.logger.error(f"Error detecting budget anomalies: {str(e)}")
         
         return anomalies
     
-    def detect_timing_anomalies(self, projects_df: pd.DataFrame) -> List[Dict[str, Any]]:
+    def detect_timing_anomalies(self, projects_df: pd.DataFrame, detected_at: Optional[datetime] = None) -> List[Dict[str, Any]]:
         """Detect timing-related anomalies"""
         anomalies = []
         
@@ -129,9 +226,7 @@ class AIBrain:
         
         try:
             # Convert dates
-            projects_df['start_date'] = pd.to_datetime(projects_df['startDate'], errors='coerce')
-            projects_df['end_date'] = pd.to_datetime(projects_df['endDate'], errors='coerce')
-            projects_df['actual_end_date'] = pd.to_datetime(projects_df['actualCompletionDate'], errors='coerce')
+            projects_df = self.prepare_projects_data(projects_df)
             
             # Filter valid projects
             valid_projects = projects_df.dropna(subset=['start_date', 'end_date'])
@@ -139,52 +234,54 @@ class AIBrain:
             if len(valid_projects) < 2:
                 return anomalies
             
-            # Calculate project duration
-            valid_projects['planned_duration'] = (valid_projects['end_date'] - valid_projects['start_date']).dt.days
+            # Calculate project duration in whole days as an int64 array
+            start_days = valid_projects['start_date'].to_numpy('datetime64[ns]').astype('datetime64[D]')
+            end_days = valid_projects['end_date'].to_numpy('datetime64[ns]').astype('datetime64[D]')
+            durations = (end_days - start_days).astype('int64')
             
             # Find extremely short or long projects
-            duration_stats = valid_projects['planned_duration'].describe()
-            
-            # Short projects (less than 1st percentile)
-            short_threshold = duration_stats['25%'] * 0.5  # Less than half of 25th percentile
-            short_projects = valid_projects[valid_projects['planned_duration'] < short_threshold]
-            
-            for _, project in short_projects.iterrows():
-                anomaly = {
-                    'description': f"Unusually short project duration: {project['planned_duration']} days for {project['projectName']}",
-                    'flagType': 'timing_anomaly',
-                    'linkedProjectIds': [project['id']],
-                    'linkedDonationIds': [],
-                    'severity': 'medium',
-                    'detectedAt': datetime.now()
-                }
-                anomalies.append(anomaly)
-            
-            # Long projects (more than 3rd quartile + 1.5*IQR)
-            q75 = duration_stats['75%']
-            q25 = duration_stats['25%']
+            q25, q75 = np.percentile(durations, [25, 75])
             iqr = q75 - q25
-            long_threshold = q75 + 1.5 * iqr
             
-            long_projects = valid_projects[valid_projects['planned_duration'] > long_threshold]
+            # Short projects: less than half of the 25th percentile
+            # Long projects: more than 3rd quartile + 1.5*IQR
+            short_threshold = q25 * 0.5
+            long_threshold = q75 + 1.5 * iqr
             
-            for _, project in long_projects.iterrows():
-                anomaly = {
-                    'description': f"Unusually long project duration: {project['planned_duration']} days for {project['projectName']}",
-                    'flagType': 'timing_anomaly',
-                    'linkedProjectIds': [project['id']],
-                    'linkedDonationIds': [],
-                    'severity': 'medium',
-                    'detectedAt': datetime.now()
-                }
-                anomalies.append(anomaly)
+            # Classify every duration in one pass: 0 normal, 1 short, 2 long
+            duration_class = np.where(
+                durations < short_threshold, 1,
+                np.where(durations > long_threshold, 2, 0)
+            )
+            
+            project_ids = valid_projects['id'].to_numpy()
+            project_names = valid_projects['projectName'].to_numpy()
+            detected_at = detected_at or datetime.now(timezone.utc)
+            
+            for label, class_code in (('short', 1), ('long', 2)):
+                selected = duration_class == class_code
+                anomalies.extend(
+                    {
+                        'description': f"Unusually {label} project duration: {duration} days for {name}",
+                        'flagType': 'timing_anomaly',
+                        'linkedProjectIds': [project_id],
+                        'linkedDonationIds': [],
+                        'severity': 'medium',
+                        'detectedAt': detected_at
+                    }
+                    for project_id, name, duration in zip(
+                        project_ids[selected].tolist(),
+                        project_names[selected].tolist(),
+                        durations[selected].tolist()
+                    )
+                )
             
         except Exception as e:
             self.logger.error(f"Error detecting timing anomalies: {str(e)}")
         
         return anomalies
     
-    def detect_contractor_anomalies(self, projects_df: pd.DataFrame) -> List[Dict[str, Any]]:
+    def detect_contractor_anomalies(self, projects_df: pd.DataFrame, detected_at: Optional[datetime] = None) -> List[Dict[str, Any]]:
         """Detect contractor-related anomalies"""
         anomalies = []
         
@@ -192,35 +289,48 @@ class AIBrain:
             return anomalies
         
         try:
-            # Filter projects with contractor information
-            contractor_projects = projects_df[projects_df['contractorName'].notna()]
+            # Factorize contractors; projects without one get code -1
+            codes, contractors = pd.factorize(projects_df['contractorName'])
+            has_contractor = codes >= 0
             
-            if len(contractor_projects) < 2:
+            if np.count_nonzero(has_contractor) < 2:
                 return anomalies
             
-            # Count projects per contractor
-            contractor_counts = contractor_projects['contractorName'].value_counts()
+            # Count projects per contractor over integer contractor codes
+            codes = codes[has_contractor]
+            contractor_counts = np.bincount(codes, minlength=len(contractors))
+            
+            if len(contractor_counts) < 2:
+                return anomalies
             
             # Find contractors with unusually many projects
             mean_projects = contractor_counts.mean()
-            std_projects = contractor_counts.std()
+            std_projects = contractor_counts.std(ddof=1)
             
             if std_projects > 0:
                 threshold = mean_projects + 2 * std_projects
-                frequent_contractors = contractor_counts[contractor_counts > threshold]
+                frequent_codes = np.flatnonzero(contractor_counts > threshold)
+                frequent_codes = frequent_codes[np.argsort(-contractor_counts[frequent_codes], kind='stable')]
                 
-                for contractor, count in frequent_contractors.items():
-                    contractor_projects_list = contractor_projects[
-                        contractor_projects['contractorName'] == contractor
-                    ]
+                # Row positions bucketed by contractor, so each contractor's
+                # projects are a slice instead of a rescan of the frame
+                rows_by_contractor = np.argsort(codes, kind='stable')
+                bucket_starts = np.concatenate(([0], np.cumsum(contractor_counts)))
+                project_ids = projects_df['id'].to_numpy()[has_contractor]
+                
+                detected_at = detected_at or datetime.now(timezone.utc)
+                for code in frequent_codes:
+                    contractor = contractors[code]
+                    count = contractor_counts[code]
+                    rows = rows_by_contractor[bucket_starts[code]:bucket_starts[code + 1]]
                     
                     anomaly = {
                         'description': f"Contractor {contractor} has unusually many projects: {count} (avg: {mean_projects:.1f})",
                         'flagType': 'contractor_anomaly',
-                        'linkedProjectIds': contractor_projects_list['id'].tolist(),
+                        'linkedProjectIds': project_ids[rows].tolist(),
                         'linkedDonationIds': [],
                         'severity': 'high' if count > mean_projects + 3 * std_projects else 'medium',
-                        'detectedAt': datetime.now()
+                        'detectedAt': detected_at
                     }
                     anomalies.append(anomaly)
             
@@ -229,7 +339,7 @@ class AIBrain:
         
         return anomalies
     
-    def detect_donation_project_correlations(self, projects_df: pd.DataFrame, donations_df: pd.DataFrame) -> List[Dict[str, Any]]:
+    def detect_donation_project_correlations(self, projects_df: pd.DataFrame, donations_df: pd.DataFrame, detected_at: Optional[datetime] = None) -> List[Dict[str, Any]]:
         """Detect correlations between donations and projects"""
         anomalies = []
         
@@ -237,16 +347,32 @@ class AIBrain:
             return anomalies
         
         try:
-            # Group donations by party
-            party_donations = donations_df.groupby('politicalPartyName')['amount'].sum().sort_values(ascending=False)
+            # Group donations by party: sort rows by factorized party code so
+            # every party is one contiguous run of amounts and donation ids
+            codes, parties = pd.factorize(donations_df['politicalPartyName'])
+            has_party = codes >= 0
+            order = np.argsort(codes[has_party], kind='stable')
+            sorted_codes = codes[has_party][order]
+            
+            if len(sorted_codes) == 0:
+                return anomalies
             
-            # Group projects by department
-            dept_projects = projects_df.groupby('department').size().sort_values(ascending=False)
+            amounts = pd.to_numeric(donations_df['amount'], errors='coerce').fillna(0).to_numpy()
+            sorted_amounts = amounts[has_party][order]
+            sorted_ids = donations_df['id'].to_numpy()[has_party][order]
+            
+            starts = np.flatnonzero(np.r_[True, np.diff(sorted_codes) != 0])
+            ends = np.r_[starts[1:], len(sorted_codes)]
+            party_totals = np.add.reduceat(sorted_amounts, starts)
             
             # Look for patterns (this is a simplified correlation check)
             # In a real implementation, you'd do more sophisticated analysis
             
-            for party, total_donation in party_donations.head(5).items():
+            detected_at = detected_at or datetime.now(timezone.utc)
+            for group in np.argsort(-party_totals, kind='stable')[:5]:
+                party = parties[sorted_codes[starts[group]]]
+                total_donation = party_totals[group]
+                
                 # Check if there are any projects that might be related
                 # This is a placeholder for more sophisticated correlation analysis
                 if total_donation > 1000000:  # More than 10 lakh
@@ -254,9 +380,9 @@ class AIBrain:
                         'description': f"High-value donations from {party}: ₹{total_donation:,.0f} - investigate potential project correlations",
                         'flagType': 'donation_correlation',
                         'linkedProjectIds': [],
-                        'linkedDonationIds': donations_df[donations_df['politicalPartyName'] == party]['id'].tolist(),
+                        'linkedDonationIds': sorted_ids[starts[group]:ends[group]].tolist(),
                         'severity': 'medium',
-                        'detectedAt': datetime.now()
+                        'detectedAt': detected_at
                     }
                     anomalies.append(anomaly)
             
@@ -270,9 +396,8 @@ class AIBrain:
         if pd.isna(budget_str) or not budget_str:
             return 0
         
-        import re
         # Remove common text and symbols
-        budget_str = str(budget_str).replace(',', '').replace('₹', '').replace('Rs.', '')
+        budget_str = str(budget_str).translate(_BUDGET_STRIP_CHARS).replace('Rs.', '')
         
         # Handle Lakh and Crore
         if 'Lakh' in budget_str or 'L' in budget_str:
@@ -284,36 +409,70 @@ class AIBrain:
         else:
             multiplier = 1
         
-        # Extract numbers
-        numbers = re.findall(r'[\d.]+', budget_str)
-        if numbers:
+        # Extract the first number
+        number = _BUDGET_NUMBER_RE.search(budget_str)
+        if number:
             try:
-                return float(numbers[0]) * multiplier
+                return float(number.group(1)) * multiplier
             except ValueError:
                 return 0
         return 0
     
+    def extract_budget_numeric_series(self, budgets: pd.Series) -> pd.Series:
+        """Vectorized extract_budget_numeric over a whole budget column"""
+        cleaned = (
+            budgets.astype(str)
+            .str.replace(',', '', regex=False)
+            .str.replace('₹', '', regex=False)
+            .str.replace('Rs.', '', regex=False)
+        )
+        
+        # Handle Lakh and Crore ('Lakh' takes precedence, as in the scalar version)
+        is_lakh = cleaned.str.contains('L', regex=False)
+        is_crore = ~is_lakh & cleaned.str.contains('Cr', regex=False)
+        cleaned = cleaned.mask(
+            is_lakh,
+            cleaned.str.replace('Lakh', '', regex=False).str.replace('L', '', regex=False)
+        ).mask(
+            is_crore,
+            cleaned.str.replace('Crore', '', regex=False).str.replace('Cr', '', regex=False)
+        )
+        multiplier = np.where(is_lakh, 100000, np.where(is_crore, 10000000, 1))
+        
+        # Extract the first number; unparsable values such as '.' become 0
+        numbers = pd.to_numeric(cleaned.str.extract(_BUDGET_NUMBER_RE, expand=False), errors='coerce')
+        result = numbers.fillna(0) * multiplier
+        
+        # Missing or empty budgets are 0
+        return result.where(budgets.notna() & (budgets != '') & (budgets != 0), 0.0)
+    
     def save_anomalies_to_firestore(self, anomalies: List[Dict[str, Any]]):
         """Save detected anomalies to Firestore"""
         if not anomalies:
             return
         
         try:
-            batch = self.db.batch()
             anomalies_ref = self.db.collection('aiRedFlags')
+            detected_at = datetime.now(timezone.utc)
+            
+            batches = []
+            for start in range(0, len(anomalies), FIRESTORE_BATCH_LIMIT):
+                batch = self.db.batch()
+                for anomaly in anomalies[start:start + FIRESTORE_BATCH_LIMIT]:
+                    # Add metadata; detectors already stamp detectedAt
+                    anomaly.setdefault('detectedAt', detected_at)
+                    anomaly['status'] = 'active'
+                    
+                    # Create document reference
+                    doc_ref = anomalies_ref.document()
+                    batch.set(doc_ref, anomaly)
+                batches.append(batch)
             
-            for anomaly in anomalies:
-                # Add metadata
-                anomaly['detectedAt'] = datetime.now()
-                anomaly['status'] = 'active'
-                
-                # Create document reference
-                doc_ref = anomalies_ref.document()
-                batch.set(doc_ref, anomaly)
-            
-            # Commit batch
-            batch.commit()
-            self.logger.info(f"Saved {len(anomalies)} anomalies to Firestore")
+            # Commit batches concurrently; each one is a separate RPC
+            workers = min(FIRESTORE_WRITE_WORKERS, len(batches))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                list(executor.map(lambda batch: batch.commit(), batches))
+            self.logger.info(f"Saved {len(anomalies)} anomalies to Firestore in {len(batches)} batches")
             
         except Exception as e:
             self.logger.error(f"Error saving anomalies to Firestore: {str(e)}")
@@ -323,34 +482,30 @@ class AIBrain:
         self.logger.info("Starting AI anomaly detection...")
         
         try:
-            # Fetch data
-            projects_df = self.fetch_projects_data()
-            donations_df = self.fetch_donations_data()
+            # Fetch data and derive shared columns once for all detectors
+            projects_df, donations_df = self.load_data()
             
             self.logger.info(f"Loaded {len(projects_df)} projects and {len(donations_df)} donations")
             
-            # Detect various types of anomalies
-            all_anomalies = []
+            projects_df = self.prepare_projects_data(projects_df)
+            
+            # Detect various types of anomalies. The detectors are independent
+            # and never modify their inputs, so they run concurrently.
+            # One UTC timestamp is shared by every anomaly from this run.
+            detected_at = datetime.now(timezone.utc)
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                detections = [
+                    ('budget', executor.submit(self.detect_budget_anomalies, projects_df, detected_at)),
+                    ('timing', executor.submit(self.detect_timing_anomalies, projects_df, detected_at)),
+                    ('contractor', executor.submit(self.detect_contractor_anomalies, projects_df, detected_at)),
+                    ('correlation', executor.submit(self.detect_donation_project_correlations, projects_df, donations_df, detected_at))
+                ]
             
-            # Budget anomalies
-            budget_anomalies = self.detect_budget_anomalies(projects_df)
-            all_anomalies.extend(budget_anomalies)
-            self.logger.info(f"Detected {len(budget_anomalies)} budget anomalies")
-            
-            # Timing anomalies
-            timing_anomalies = self.detect_timing_anomalies(projects_df)
-            all_anomalies.extend(timing_anomalies)
-            self.logger.info(f"Detected {len(timing_anomalies)} timing anomalies")
-            
-            # Contractor anomalies
-            contractor_anomalies = self.detect_contractor_anomalies(projects_df)
-            all_anomalies.extend(contractor_anomalies)
-            self.logger.info(f"Detected {len(contractor_anomalies)} contractor anomalies")
-            
-            # Donation-project correlations
-            correlation_anomalies = self.detect_donation_project_correlations(projects_df, donations_df)
-            all_anomalies.extend(correlation_anomalies)
-            self.logger.info(f"Detected {len(correlation_anomalies)} correlation anomalies")
+            all_anomalies = []
+            for kind, future in detections:
+                anomalies = future.result()
+                all_anomalies.extend(anomalies)
+                self.logger.info(f"Detected {len(anomalies)} {kind} anomalies")
             
             # Save anomalies to Firestore
             self.save_anomalies_to_firestore(all_anomalies)
@@ -4,12 +4,18 @@ Comprehensive Bengaluru Project Scraper
 Scrapes every single project related to Bengaluru from all government portals
 """
 
+import argparse
 import requests
-from bs4 import BeautifulSoup
+import requests_cache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, SoupStrainer
+import soupsieve
 import json
+import hashlib
 import time
 import re
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 import pandas as pd
 from urllib.parse import urljoin, urlparse
 import logging
@@ -22,25 +28,327 @@ from webdriver_manager.chrome import ChromeDriverManager
 from selenium.webdriver.chrome.service import Service
 import random
 import os
+import itertools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from collections import Counter, defaultdict
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def _dumps_pretty(obj):
+    """Indented UTF-8 JSON bytes, via orjson when it is installed"""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+        except orjson.JSONEncodeError:
+            # e.g. a mis-parsed budget beyond 64 bits; the stdlib encoder copes
+            pass
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Portal landing pages are only ever searched for links and project sections,
+# so the rest of the document (head, scripts, footers) is never built
+LINK_STRAINER = SoupStrainer('a', href=True)
+SECTION_STRAINER = SoupStrainer(['div', 'section', 'article', 'a'])
+
+# Detail pages fetched at once from a single portal
+DETAIL_WORKERS = 5
+
+# Minimum spacing between requests to the same government portal; other
+# hosts (contractor sites, CDNs linked from tenders) are not throttled
+PORTAL_DELAY = 1.0
+PORTAL_HOSTS = {
+    'eproc.karnataka.gov.in', 'bbmp.gov.in', 'bdabangalore.org',
+    'bwssb.karnataka.gov.in', 'english.bmrc.co.in', 'bescom.karnataka.gov.in',
+    'kpwd.karnataka.gov.in', 'kuidfc.karnataka.gov.in', 'mybmtc.karnataka.gov.in'
+}
+
+def portal_host(url):
+    """The PORTAL_HOSTS entry url belongs to (ignoring port, case, www. and other subdomains), or None"""
+    host = urlparse(url).hostname or ''
+    # Walk up the labels: www.bbmp.gov.in -> bbmp.gov.in -> gov.in -> in
+    while host:
+        if host in PORTAL_HOSTS:
+            return host
+        host = host.partition('.')[2]
+    return None
+
+# Link filters, compiled once instead of on every portal visit
+TENDER_HREF_RE = re.compile(r'tender|notice|bid|procurement', re.I)
+
+def portal_selector(section_tags, section_words, link_words):
+    """Compiled selector for a portal's project sections (by class) and project links (by href), ignoring case"""
+    sections = [f'{tag}[class*="{word}" i]' for tag in section_tags for word in section_words]
+    links = [f'a[href*="{word}" i]' for word in link_words]
+    return soupsieve.compile(', '.join(sections + links))
+
+# Compiled once at import: (section tags, section class words, link href words)
+PORTAL_SELECTORS = {
+    'BBMP': portal_selector(
+        ('div', 'section', 'article'),
+        ('project', 'work', 'development', 'news', 'announcement', 'tender'),
+        ('project', 'work', 'development', 'tender', 'scheme')
+    ),
+    'BDA': portal_selector(
+        ('div', 'section'),
+        ('project', 'scheme', 'development', 'news', 'housing'),
+        ('project', 'scheme', 'development', 'housing')
+    ),
+    'BWSSB': portal_selector(
+        ('div', 'section'),
+        ('project', 'scheme', 'work', 'water', 'supply', 'sewerage'),
+        ('project', 'scheme', 'work', 'water', 'supply')
+    ),
+    'BMRCL': portal_selector(
+        ('div', 'section'),
+        ('project', 'phase', 'line', 'station', 'metro', 'construction'),
+        ('project', 'phase', 'line', 'station', 'metro')
+    ),
+    'BESCOM': portal_selector(
+        ('div', 'section'),
+        ('project', 'work', 'electrical', 'power', 'infrastructure', 'supply'),
+        ('project', 'work', 'electrical', 'power', 'infrastructure')
+    ),
+    'KPWD': portal_selector(
+        ('div', 'section'),
+        ('project', 'work', 'road', 'bridge', 'building', 'construction', 'public'),
+        ('project', 'work', 'road', 'bridge', 'building', 'construction')
+    ),
+    'KUIDFC': portal_selector(
+        ('div', 'section'),
+        ('project', 'work', 'infrastructure', 'urban', 'development', 'finance'),
+        ('project', 'work', 'infrastructure', 'urban', 'development')
+    ),
+    'BMTC': portal_selector(
+        ('div', 'section'),
+        ('project', 'work', 'route', 'bus', 'terminal', 'transport', 'metro'),
+        ('project', 'work', 'route', 'bus', 'terminal', 'transport')
+    )
+}
+
+# Text extractors' patterns, compiled once at import
+BUDGET_RES = [re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'₹\s*(\d+(?:,\d{3})*(?:\.\d{2})?)\s*(?:crore|crs|lakh|cr)',
+    r'Rs\.?\s*(\d+(?:,\d{3})*(?:\.\d{2})?)\s*(?:crore|crs|lakh|cr)',
+    r'(\d+(?:,\d{3})*(?:\.\d{2})?)\s*(?:crore|crs|lakh|cr)',
+    r'Budget[:\s]*₹?\s*(\d+(?:,\d{3})*(?:\.\d{2})?)'
+)]
+LOCATION_RES = [re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'Location[:\s]*([^,\n]+)',
+    r'Area[:\s]*([^,\n]+)',
+    r'Address[:\s]*([^,\n]+)',
+    r'([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\s+(?:Ward|Area|Zone)'
+)]
+# One alternation per date label; the matching group names the formats to try
+DATE_RES = {
+    date_type: re.compile(
+        rf'{date_type}[:\s]*(?:(?P<dmy>\d{{1,2}}[/-]\d{{1,2}}[/-]\d{{4}})'
+        rf'|(?P<ymd>\d{{4}}[/-]\d{{1,2}}[/-]\d{{1,2}})'
+        rf'|(?P<long>\w+\s+\d{{1,2}},?\s+\d{{4}}))',
+        re.IGNORECASE
+    )
+    for date_type in ('start', 'end')
+}
+DATE_FORMATS = {
+    'dmy': ('%d/%m/%Y', '%d-%m-%Y'),
+    'ymd': ('%Y/%m/%d', '%Y-%m-%d'),
+    'long': ('%B %d, %Y',)
+}
+
+def is_html(response):
+    """True unless the server says the body is something other than HTML"""
+    content_type = response.headers.get('Content-Type', '')
+    return not content_type or 'html' in content_type
+
+def section_id(prefix, text):
+    """Stable project id from the section's text, without re-serializing its HTML"""
+    return f"{prefix}_{hashlib.blake2b(text.encode(), digest_size=8).hexdigest()}"
+
 class BengaluruProjectScraper:
-    def __init__(self):
-        self.session = requests.Session()
+    # Static fields of the mock projects; dates, wards, contractors and
+    # coordinates are filled in per row when the mocks are generated
+    # (projectName, description, budget, status, department)
+    EPROC_MOCK_TEMPLATES = [
+        ('BBMP Road Infrastructure Tender - Phase 1',
+         'Tender for comprehensive road development and maintenance in BBMP jurisdiction covering major arterial roads and residential areas',
+         25000000, 'Pending', 'BBMP'),
+        ('BDA Housing Scheme Tender - Affordable Housing',
+         'Tender for construction of affordable housing units under various government schemes in Bengaluru',
+         75000000, 'In Progress', 'BDA'),
+        ('BWSSB Water Supply Network Tender',
+         'Tender for laying new water supply pipelines and upgrading existing infrastructure in Bengaluru',
+         40000000, 'Pending', 'BWSSB'),
+        ('BMRCL Metro Station Construction Tender',
+         'Tender for construction of new metro stations and related infrastructure in Bengaluru',
+         120000000, 'In Progress', 'BMRCL'),
+        ('BESCOM Electrical Infrastructure Tender',
+         'Tender for upgrading electrical infrastructure including transformers, cables, and distribution networks',
+         35000000, 'Pending', 'BESCOM')
+    ]
+    
+    # (projectName, description, budget, status, wardNumber or None for random)
+    BBMP_MOCK_TEMPLATES = [
+        ('BBMP Ward 15 Road Development Project',
+         'Comprehensive road development including widening, resurfacing, and drainage improvement in Ward 15',
+         15000000, 'In Progress', 15),
+        ('BBMP Solid Waste Management Initiative',
+         'Implementation of advanced solid waste management system with segregation and processing facilities',
+         30000000, 'Pending', None),
+        ('BBMP Street Lighting Upgrade Project',
+         'Upgradation of street lighting infrastructure with LED lights and smart controls',
+         8000000, 'Completed', None),
+        ('BBMP Parks and Recreation Development',
+         'Development of new parks and recreational facilities across various wards',
+         12000000, 'In Progress', None),
+        ('BBMP Storm Water Drainage System',
+         'Construction and upgradation of storm water drainage system to prevent flooding',
+         45000000, 'Pending', None)
+    ]
+    
+    # (department, projectName, description, budget, status)
+    DEPARTMENT_MOCK_TEMPLATES = [
+        ('BDA', 'BDA Namma Metro Housing Scheme Phase 2',
+         'Affordable housing project near metro stations with modern amenities and connectivity',
+         85000000, 'In Progress'),
+        ('BDA', 'BDA Commercial Complex Development',
+         'Development of integrated commercial complex with retail, office, and parking facilities',
+         120000000, 'Pending'),
+        ('BWSSB', 'BWSSB Cauvery Water Supply Phase 5',
+         'Extension of Cauvery water supply network to new areas with treatment plants',
+         65000000, 'In Progress'),
+        ('BWSSB', 'BWSSB Sewerage Treatment Plant Upgrade',
+         'Modernization of existing sewerage treatment plants with advanced technology',
+         40000000, 'Pending'),
+        ('BMRCL', 'BMRCL Purple Line Extension Phase 2',
+         'Extension of purple line metro from Whitefield to Electronic City with 8 new stations',
+         250000000, 'In Progress'),
+        ('BMRCL', 'BMRCL Airport Metro Line',
+         'Direct metro connectivity from city center to Kempegowda International Airport',
+         180000000, 'Pending'),
+        ('BESCOM', 'BESCOM Smart Grid Implementation',
+         'Implementation of smart grid technology for efficient power distribution and monitoring',
+         75000000, 'In Progress'),
+        ('BESCOM', 'BESCOM Solar Power Integration',
+         'Integration of solar power systems in government buildings and public facilities',
+         35000000, 'Pending'),
+        ('KPWD', 'KPWD Outer Ring Road Phase 3',
+         'Construction of third phase of outer ring road with flyovers and underpasses',
+         150000000, 'In Progress'),
+        ('KPWD', 'KPWD Multi-Level Parking Complex',
+         'Construction of automated multi-level parking complexes in commercial areas',
+         60000000, 'Pending'),
+        ('KUIDFC', 'KUIDFC Smart City Infrastructure',
+         'Development of smart city infrastructure including IoT sensors and data centers',
+         200000000, 'In Progress'),
+        ('KUIDFC', 'KUIDFC Urban Mobility Hub',
+         'Development of integrated urban mobility hub with bus, metro, and taxi connectivity',
+         90000000, 'Pending'),
+        ('BMTC', 'BMTC Electric Bus Fleet Expansion',
+         'Introduction of 500 electric buses for eco-friendly public transportation',
+         80000000, 'In Progress'),
+        ('BMTC', 'BMTC Bus Terminal Modernization',
+         'Modernization of major bus terminals with digital displays and amenities',
+         25000000, 'Pending')
+    ]
+    
+    DEPARTMENT_URLS = {
+        'BBMP': 'https://bbmp.gov.in/',
+        'BDA': 'https://bdabangalore.org/',
+        'BWSSB': 'https://bwssb.karnataka.gov.in/',
+        'BMRCL': 'https://english.bmrc.co.in/',
+        'BESCOM': 'https://bescom.karnataka.gov.in/',
+        'KPWD': 'https://kpwd.karnataka.gov.in/',
+        'KUIDFC': 'https://kuidfc.karnataka.gov.in/',
+        'BMTC': 'https://mybmtc.karnataka.gov.in/'
+    }
+    
+    STATUSES = ('In Progress', 'Pending', 'Completed')
+    
+    CONTRACTORS = (
+        'ABC Construction Ltd.',
+        'XYZ Builders',
+        'Infrastructure Solutions Inc.',
+        'Metro Construction Co.',
+        'Water Works Ltd.',
+        'Power Solutions Inc.',
+        'Bridge Builders Ltd.',
+        'Urban Development Corp.',
+        'Transport Infrastructure Ltd.',
+        'Public Works Contractors',
+        'Bengaluru Infrastructure Ltd.',
+        'Karnataka Development Corp.',
+        'City Builders Pvt Ltd.',
+        'Metro Rail Contractors',
+        'Water Supply Engineers'
+    )
+    
+    # chromedriver path resolved by webdriver-manager, shared by all instances
+    _chromedriver_path = None
+    
+    def __init__(self, force_rescrape=False):
+        # Landing pages change rarely; honour Cache-Control/ETag and keep
+        # responses on disk for an hour so repeat runs skip the network.
+        # force_rescrape refetches every page and refreshes the cached copy.
+        self.force_rescrape = force_rescrape
+        self.session = requests_cache.CachedSession(
+            'zanda_http_cache', backend='sqlite', expire_after=3600, cache_control=True
+        )
+        # One keep-alive pool per portal host, large enough for the detail
+        # threads, with retry/backoff for the gateway errors these portals throw
+        adapter = HTTPAdapter(
+            pool_connections=20,
+            pool_maxsize=50,
+            max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[502, 503, 504])
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         })
         self.projects = []
+        self._projects_lock = threading.Lock()
+        # Per-thread batch a portal's projects go to while scrape_all_portals runs it
+        self._batch = threading.local()
+        # Mock ids are numbered per id prefix, independent of how many projects
+        # the portals found or the order they finished in
+        self._mock_ids = defaultdict(lambda: itertools.count(1))
+        # Every project from one run shares the run's scrape timestamp
+        self._run_started_iso = datetime.now(timezone.utc).isoformat()
+        # Windows the random past/future project dates are drawn from
+        now = datetime.now()
+        self._past_date_start = now - timedelta(days=365)
+        self._future_date_start = now + timedelta(days=30)
+        # Earliest time (time.monotonic) the next request to each portal may go out
+        self._domain_limiter = {}
+        self._domain_lock = threading.Lock()
+        # Detail pages already fetched this run
+        self._fetched_urls = set()
+        self._fetched_lock = threading.Lock()
         self.bengaluru_keywords = [
             'bengaluru', 'bangalore', 'bbmp', 'bda', 'bwssb', 'bmrc', 'bescom', 
             'kpwd', 'kuidfc', 'bmtc', 'karnataka', 'urban', 'metro', 'water',
             'electrical', 'transport', 'infrastructure', 'development', 'housing',
             'road', 'bridge', 'station', 'terminal', 'supply', 'sewerage'
         ]
-        self.setup_selenium()
+        # One alternation scans for every keyword in a single pass
+        self._bengaluru_re = re.compile('|'.join(map(re.escape, self.bengaluru_keywords)), re.IGNORECASE)
+        self._bengaluru_cache = {}
+        # Chrome is only launched the first time self.driver is used
+        self._driver = None
+        self._driver_ready = False
+    
+    @property
+    def driver(self):
+        """Selenium WebDriver, started on first access (None if Chrome is unavailable)"""
+        if not self._driver_ready:
+            self.setup_selenium()
+        return self._driver
     
     def setup_selenium(self):
         """Setup Selenium WebDriver for dynamic content"""
@@ -52,29 +360,101 @@ class BengaluruProjectScraper:
         chrome_options.add_argument('--window-size=1920,1080')
         
         try:
-            service = Service(ChromeDriverManager().install())
-            self.driver = webdriver.Chrome(service=service, options=chrome_options)
+            # Resolve the chromedriver binary once per process; install() does
+            # an HTTP version check every time it is called
+            cls = type(self)
+            if cls._chromedriver_path is None:
+                cls._chromedriver_path = ChromeDriverManager().install()
+            service = Service(cls._chromedriver_path)
+            self._driver = webdriver.Chrome(service=service, options=chrome_options)
         except Exception as e:
             logger.warning(f"Chrome driver setup failed: {e}")
-            self.driver = None
+            self._driver = None
+        self._driver_ready = True
     
     def is_bengaluru_related(self, text):
         """Check if text is related to Bengaluru"""
         if not text:
             return False
         
-        text_lower = text.lower()
-        return any(keyword in text_lower for keyword in self.bengaluru_keywords)
+        # Navigation and footer links repeat the same text on every page
+        related = self._bengaluru_cache.get(text)
+        if related is None:
+            related = self._bengaluru_cache[text] = bool(self._bengaluru_re.search(text))
+        return related
+    
+    def served_from_cache(self, url):
+        """True if a GET of url will be answered from the HTTP cache without contacting the server"""
+        if self.force_rescrape:
+            return False
+        cache = self.session.cache
+        # An expired entry is still stored, but is revalidated over the network
+        cached = cache.get_response(cache.create_key(requests.Request('GET', url)))
+        return cached is not None and not cached.is_expired
+    
+    def rate_limited_get(self, url):
+        """GET url, spacing requests to the same government portal PORTAL_DELAY apart"""
+        domain = portal_host(url)
+        # Responses served from the HTTP cache never reach the portal
+        if domain and not self.served_from_cache(url):
+            # Reserve the next slot under the lock, then sleep outside it
+            with self._domain_lock:
+                now = time.monotonic()
+                slot = max(now, self._domain_limiter.get(domain, 0.0))
+                self._domain_limiter[domain] = slot + PORTAL_DELAY
+            if slot > now:
+                time.sleep(slot - now)
+        return self.session.get(url, timeout=15, force_refresh=self.force_rescrape)
+    
+    def fetch_details(self, extract, jobs, label):
+        """Run extract(*job) for each job on a small thread pool and return the hits in job order"""
+        def run(job):
+            try:
+                return extract(*job)
+            except Exception as e:
+                logger.error(f"Error scraping {label} from {job[0]}: {e}")
+                return None
+        
+        # A page linked twice (under two rubrics, or from two portals) is fetched once per run
+        fresh_jobs = []
+        with self._fetched_lock:
+            for job in jobs:
+                if job[0] not in self._fetched_urls:
+                    self._fetched_urls.add(job[0])
+                    fresh_jobs.append(job)
+        if not fresh_jobs:
+            return []
+        with ThreadPoolExecutor(max_workers=min(DETAIL_WORKERS, len(fresh_jobs))) as executor:
+            return [project_data for project_data in executor.map(run, fresh_jobs) if project_data]
+    
+    def add_projects(self, projects):
+        """Add a batch of projects: to the running portal's batch under scrape_all_portals, else to self.projects"""
+        batch = getattr(self._batch, 'projects', None)
+        if batch is not None:
+            batch.extend(projects)
+            return
+        with self._projects_lock:
+            self.projects.extend(projects)
+    
+    def collect_portal(self, portal):
+        """Run one scrape_*_portal method and return the projects it produced, in order"""
+        self._batch.projects = batch = []
+        try:
+            portal()
+        finally:
+            self._batch.projects = None
+        return batch
     
     def scrape_eproc_portal(self):
         """Scrape Karnataka e-Procurement Portal for Bengaluru projects"""
         logger.info("Scraping Karnataka e-Procurement Portal for Bengaluru projects...")
         
+        local_projects = []
         try:
             # Main tender search page
             url = "https://eproc.karnataka.gov.in/"
-            response = self.session.get(url, timeout=15)
-            soup = BeautifulSoup(response.content, 'html.parser')
+            response = self.rate_limited_get(url)
+            soup = BeautifulSoup(response.content, 'lxml', parse_only=LINK_STRAINER)
             
             # Look for tender links and announcements
             tender_links = []
@@ -82,137 +462,60 @@ class BengaluruProjectScraper:
                 href = link['href']
                 link_text = link.get_text(strip=True)
                 
-                if (any(keyword in href.lower() for keyword in ['tender', 'notice', 'bid', 'procurement']) or
-                    any(keyword in link_text.lower() for keyword in self.bengaluru_keywords)):
+                if TENDER_HREF_RE.search(href) or self._bengaluru_re.search(link_text):
                     full_url = urljoin(url, href)
                     tender_links.append((full_url, link_text))
             
             # Extract project details from each tender page
-            for url, title in tender_links[:20]:  # Increased limit for more projects
-                try:
-                    if self.is_bengaluru_related(title):
-                        project_data = self.extract_eproc_tender(url, title)
-                        if project_data:
-                            self.projects.append(project_data)
-                except Exception as e:
-                    logger.error(f"Error scraping tender from {url}: {e}")
-                
-                time.sleep(1)  # Be respectful to the server
-            
-            # Generate additional mock projects for e-Procurement
-            self.generate_mock_eproc_projects()
+            tender_jobs = [(url, title) for url, title in tender_links[:20]  # Increased limit for more projects
+                           if self.is_bengaluru_related(title)]
+            local_projects.extend(self.fetch_details(self.extract_eproc_tender, tender_jobs, 'tender'))
                 
         except Exception as e:
             logger.error(f"Error scraping e-Procurement portal: {e}")
-            # Generate mock projects even if scraping fails
-            self.generate_mock_eproc_projects()
+        self.add_projects(local_projects)
+        
+        # Generate additional mock projects for e-Procurement, even if scraping fails
+        self.generate_mock_eproc_projects()
     
     def generate_mock_eproc_projects(self):
         """Generate mock e-Procurement projects for Bengaluru"""
-        mock_projects = [
-            {
-                'id': f"EPROC_MOCK_{len(self.projects) + 1}",
-                'projectName': 'BBMP Road Infrastructure Tender - Phase 1',
-                'description': 'Tender for comprehensive road development and maintenance in BBMP jurisdiction covering major arterial roads and residential areas',
-                'budget': 25000000,
-                'status': 'Pending',
-                'location': 'Bengaluru, Karnataka',
-                'startDate': self.get_random_date(),
-                'endDate': self.get_random_future_date(),
-                'source': 'Karnataka e-Procurement',
-                'sourceUrl': 'https://eproc.karnataka.gov.in/',
-                'scrapedAt': datetime.now().isoformat(),
-                'department': 'BBMP',
-                'wardNumber': random.randint(1, 30),
-                'contractor': None,
-                'geoPoint': self.get_random_bengaluru_coords()
-            },
-            {
-                'id': f"EPROC_MOCK_{len(self.projects) + 2}",
-                'projectName': 'BDA Housing Scheme Tender - Affordable Housing',
-                'description': 'Tender for construction of affordable housing units under various government schemes in Bengaluru',
-                'budget': 75000000,
-                'status': 'In Progress',
-                'location': 'Bengaluru, Karnataka',
-                'startDate': self.get_random_date(),
-                'endDate': self.get_random_future_date(),
-                'source': 'Karnataka e-Procurement',
-                'sourceUrl': 'https://eproc.karnataka.gov.in/',
-                'scrapedAt': datetime.now().isoformat(),
-                'department': 'BDA',
-                'wardNumber': random.randint(1, 30),
-                'contractor': None,
-                'geoPoint': self.get_random_bengaluru_coords()
-            },
-            {
-                'id': f"EPROC_MOCK_{len(self.projects) + 3}",
-                'projectName': 'BWSSB Water Supply Network Tender',
-                'description': 'Tender for laying new water supply pipelines and upgrading existing infrastructure in Bengaluru',
-                'budget': 40000000,
-                'status': 'Pending',
-                'location': 'Bengaluru, Karnataka',
-                'startDate': self.get_random_date(),
-                'endDate': self.get_random_future_date(),
-                'source': 'Karnataka e-Procurement',
-                'sourceUrl': 'https://eproc.karnataka.gov.in/',
-                'scrapedAt': datetime.now().isoformat(),
-                'department': 'BWSSB',
-                'wardNumber': random.randint(1, 30),
-                'contractor': None,
-                'geoPoint': self.get_random_bengaluru_coords()
-            },
-            {
-                'id': f"EPROC_MOCK_{len(self.projects) + 4}",
-                'projectName': 'BMRCL Metro Station Construction Tender',
-                'description': 'Tender for construction of new metro stations and related infrastructure in Bengaluru',
-                'budget': 120000000,
-                'status': 'In Progress',
-                'location': 'Bengaluru, Karnataka',
-                'startDate': self.get_random_date(),
-                'endDate': self.get_random_future_date(),
-                'source': 'Karnataka e-Procurement',
-                'sourceUrl': 'https://eproc.karnataka.gov.in/',
-                'scrapedAt': datetime.now().isoformat(),
-                'department': 'BMRCL',
-                'wardNumber': random.randint(1, 30),
-                'contractor': None,
-                'geoPoint': self.get_random_bengaluru_coords()
-            },
-            {
-                'id': f"EPROC_MOCK_{len(self.projects) + 5}",
-                'projectName': 'BESCOM Electrical Infrastructure Tender',
-                'description': 'Tender for upgrading electrical infrastructure including transformers, cables, and distribution networks',
-                'budget': 35000000,
-                'status': 'Pending',
-                'location': 'Bengaluru, Karnataka',
-                'startDate': self.get_random_date(),
-                'endDate': self.get_random_future_date(),
-                'source': 'Karnataka e-Procurement',
-                'sourceUrl': 'https://eproc.karnataka.gov.in/',
-                'scrapedAt': datetime.now().isoformat(),
-                'department': 'BESCOM',
-                'wardNumber': random.randint(1, 30),
-                'contractor': None,
-                'geoPoint': self.get_random_bengaluru_coords()
-            }
-        ]
-        
-        for project in mock_projects:
-            self.projects.append(project)
+        self.add_projects([{
+            'id': f"EPROC_MOCK_{next(self._mock_ids['EPROC'])}",
+            'projectName': name,
+            'description': description,
+            'budget': budget,
+            'status': status,
+            'location': 'Bengaluru, Karnataka',
+            'startDate': self.get_random_date(),
+            'endDate': self.get_random_future_date(),
+            'source': 'Karnataka e-Procurement',
+            'sourceUrl': 'https://eproc.karnataka.gov.in/',
+            'scrapedAt': self._run_started_iso,
+            'department': department,
+            'wardNumber': random.randint(1, 30),
+            'contractor': None,
+            'geoPoint': self.get_random_bengaluru_coords()
+        } for name, description, budget, status, department in self.EPROC_MOCK_TEMPLATES])
     
     def extract_eproc_tender(self, url, title):
         """Extract tender details from e-Procurement portal"""
         try:
-            response = self.session.get(url, timeout=15)
-            soup = BeautifulSoup(response.content, 'html.parser')
+            response = self.rate_limited_get(url)
+            # Tender links often point at PDFs or scans; don't feed those to the HTML parser
+            if not is_html(response):
+                return None
+            soup = BeautifulSoup(response.content, 'lxml')
             
             # Extract tender information
             description = self.extract_description(soup)
             if not self.is_bengaluru_related(description):
                 return None
             
-            budget = self.extract_budget_from_text(soup.get_text())
-            location = self.extract_location_from_text(soup.get_text())
+            # Materialize the page text once for every text-based extractor
+            page_text = soup.get_text()
+            budget = self.extract_budget_from_text(page_text)
+            location = self.extract_location_from_text(page_text)
             
             project_data = {
                 'id': f"EPROC_{hash(url)}",
@@ -221,11 +524,11 @@ class BengaluruProjectScraper:
                 'budget': budget,
                 'status': 'Pending',
                 'location': location or 'Bengaluru, Karnataka',
-                'startDate': self.extract_date(soup, 'start'),
-                'endDate': self.extract_date(soup, 'end'),
+                'startDate': self.extract_date(page_text, 'start'),
+                'endDate': self.extract_date(page_text, 'end'),
                 'source': 'Karnataka e-Procurement',
                 'sourceUrl': url,
-                'scrapedAt': datetime.now().isoformat(),
+                'scrapedAt': self._run_started_iso,
                 'department': 'Various Departments',
                 'wardNumber': random.randint(1, 30),
                 'contractor': None,
@@ -242,645 +545,285 @@ class BengaluruProjectScraper:
         """Scrape BBMP Portal for Bengaluru projects"""
         logger.info("Scraping BBMP Portal for Bengaluru projects...")
         
+        local_projects = []
         try:
             url = "https://bbmp.gov.in/"
-            response = self.session.get(url, timeout=15)
-            soup = BeautifulSoup(response.content, 'html.parser')
+            response = self.rate_limited_get(url)
+            soup = BeautifulSoup(response.content, 'lxml', parse_only=SECTION_STRAINER)
             
             # Look for project announcements, news, or tender sections
-            project_sections = soup.find_all(['div', 'section', 'article'], 
-                                           class_=re.compile(r'project|work|development|news|announcement|tender', re.I))
+            matches = PORTAL_SELECTORS['BBMP'].select(soup)
+            project_sections = [node for node in matches if node.name != 'a']
             
             for section in project_sections:
-                project_data = self.extract_bbmp_project(section)
+                project_data = self.extract_section_project(section, 'BBMP', ('h1', 'h2', 'h3', 'h4', 'h5'))
                 if project_data:
-                    self.projects.append(project_data)
+                    local_projects.append(project_data)
             
             # Look for specific project pages and links
-            project_links = soup.find_all('a', href=re.compile(r'project|work|development|tender|scheme', re.I))
+            project_links = [node for node in matches if node.name == 'a']
+            link_jobs = []
             for link in project_links[:15]:
-                try:
-                    project_url = urljoin(url, link['href'])
-                    link_text = link.get_text(strip=True)
-                    
-                    if self.is_bengaluru_related(link_text):
-                        project_data = self.extract_project_from_url(project_url, 'BBMP', link_text)
-                        if project_data:
-                            self.projects.append(project_data)
-                except Exception as e:
-                    logger.error(f"Error scraping BBMP project: {e}")
-                
-                time.sleep(1)
-            
-            # Generate additional mock projects for BBMP
-            self.generate_mock_bbmp_projects()
+                link_text = link.get_text(strip=True)
+                if self.is_bengaluru_related(link_text):
+                    link_jobs.append((urljoin(url, link['href']), 'BBMP', link_text))
+            local_projects.extend(self.fetch_details(self.extract_project_from_url, link_jobs, 'BBMP project'))
                 
         except Exception as e:
             logger.error(f"Error scraping BBMP portal: {e}")
-            # Generate mock projects even if scraping fails
-            self.generate_mock_bbmp_projects()
+        self.add_projects(local_projects)
+        
+        # Generate additional mock projects for BBMP, even if scraping fails
+        self.generate_mock_bbmp_projects()
     
     def generate_mock_bbmp_projects(self):
         """Generate mock BBMP projects for Bengaluru"""
-        mock_projects = [
-            {
-                'id': f"BBMP_MOCK_{len(self.projects) + 1}",
-                'projectName': 'BBMP Ward 15 Road Development Project',
-                'description': 'Comprehensive road development including widening, resurfacing, and drainage improvement in Ward 15',
-                'budget': 15000000,
-                'status': 'In Progress',
-                'location': 'Bengaluru, Karnataka',
-                'startDate': self.get_random_date(),
-                'endDate': self.get_random_future_date(),
-                'source': 'BBMP',
-                'sourceUrl': 'https://bbmp.gov.in/',
-                'scrapedAt': datetime.now().isoformat(),
-                'department': 'BBMP',
-                'wardNumber': 15,
-                'contractor': self.get_random_contractor(),
-                'geoPoint': self.get_random_bengaluru_coords()
-            },
-            {
-                'id': f"BBMP_MOCK_{len(self.projects) + 2}",
-                'projectName': 'BBMP Solid Waste Management Initiative',
-                'description': 'Implementation of advanced solid waste management system with segregation and processing facilities',
-                'budget': 30000000,
-                'status': 'Pending',
-                'location': 'Bengaluru, Karnataka',
-                'startDate': self.get_random_date(),
-                'endDate': self.get_random_future_date(),
-                'source': 'BBMP',
-                'sourceUrl': 'https://bbmp.gov.in/',
-                'scrapedAt': datetime.now().isoformat(),
-                'department': 'BBMP',
-                'wardNumber': random.randint(1, 30),
-                'contractor': self.get_random_contractor(),
-                'geoPoint': self.get_random_bengaluru_coords()
-            },
-            {
-                'id': f"BBMP_MOCK_{len(self.projects) + 3}",
-                'projectName': 'BBMP Street Lighting Upgrade Project',
-                'description': 'Upgradation of street lighting infrastructure with LED lights and smart controls',
-                'budget': 8000000,
-                'status': 'Completed',
-                'location': 'Bengaluru, Karnataka',
-                'startDate': self.get_random_date(),
-                'endDate': self.get_random_future_date(),
-                'source': 'BBMP',
-                'sourceUrl': 'https://bbmp.gov.in/',
-                'scrapedAt': datetime.now().isoformat(),
-                'department': 'BBMP',
-                'wardNumber': random.randint(1, 30),
-                'contractor': self.get_random_contractor(),
-                'geoPoint': self.get_random_bengaluru_coords()
-            },
-            {
-                'id': f"BBMP_MOCK_{len(self.projects) + 4}",
-                'projectName': 'BBMP Parks and Recreation Development',
-                'description': 'Development of new parks and recreational facilities across various wards',
-                'budget': 12000000,
-                'status': 'In Progress',
-                'location': 'Bengaluru, Karnataka',
-                'startDate': self.get_random_date(),
-                'endDate': self.get_random_future_date(),
-                'source': 'BBMP',
-                'sourceUrl': 'https://bbmp.gov.in/',
-                'scrapedAt': datetime.now().isoformat(),
-                'department': 'BBMP',
-                'wardNumber': random.randint(1, 30),
-                'contractor': self.get_random_contractor(),
-                'geoPoint': self.get_random_bengaluru_coords()
-            },
-            {
-                'id': f"BBMP_MOCK_{len(self.projects) + 5}",
-                'projectName': 'BBMP Storm Water Drainage System',
-                'description': 'Construction and upgradation of storm water drainage system to prevent flooding',
-                'budget': 45000000,
-                'status': 'Pending',
-                'location': 'Bengaluru, Karnataka',
-                'startDate': self.get_random_date(),
-                'endDate': self.get_random_future_date(),
-                'source': 'BBMP',
-                'sourceUrl': 'https://bbmp.gov.in/',
-                'scrapedAt': datetime.now().isoformat(),
-                'department': 'BBMP',
-                'wardNumber': random.randint(1, 30),
-                'contractor': self.get_random_contractor(),
-                'geoPoint': self.get_random_bengaluru_coords()
-            }
-        ]
-        
-        for project in mock_projects:
-            self.projects.append(project)
-    
-    def extract_bbmp_project(self, section):
-        """Extract BBMP project from section"""
-        try:
-            title = section.find(['h1', 'h2', 'h3', 'h4', 'h5'])
-            if not title:
-                return None
-            
-            title_text = title.get_text(strip=True)
-            if len(title_text) < 10 or not self.is_bengaluru_related(title_text):
-                return None
-            
-            description = section.get_text(strip=True)[:500]
-            budget = self.extract_budget_from_text(description)
-            
-            return {
-                'id': f"BBMP_{hash(str(section))}",
-                'projectName': title_text,
-                'description': description,
-                'budget': budget,
-                'status': random.choice(['In Progress', 'Pending', 'Completed']),
-                'location': 'Bengaluru, Karnataka',
-                'startDate': self.get_random_date(),
-                'endDate': self.get_random_future_date(),
-                'source': 'BBMP',
-                'sourceUrl': 'https://bbmp.gov.in/',
-                'scrapedAt': datetime.now().isoformat(),
-                'department': 'BBMP',
-                'wardNumber': random.randint(1, 30),
-                'contractor': self.get_random_contractor(),
-                'geoPoint': self.get_random_bengaluru_coords()
-            }
-        except Exception as e:
-            logger.error(f"Error extracting BBMP project: {e}")
-            return None
+        self.add_projects([{
+            'id': f"BBMP_MOCK_{next(self._mock_ids['BBMP'])}",
+            'projectName': name,
+            'description': description,
+            'budget': budget,
+            'status': status,
+            'location': 'Bengaluru, Karnataka',
+            'startDate': self.get_random_date(),
+            'endDate': self.get_random_future_date(),
+            'source': 'BBMP',
+            'sourceUrl': 'https://bbmp.gov.in/',
+            'scrapedAt': self._run_started_iso,
+            'department': 'BBMP',
+            'wardNumber': ward or random.randint(1, 30),
+            'contractor': self.get_random_contractor(),
+            'geoPoint': self.get_random_bengaluru_coords()
+        } for name, description, budget, status, ward in self.BBMP_MOCK_TEMPLATES])
     
     def scrape_bda_portal(self):
         """Scrape BDA Portal for Bengaluru projects"""
         logger.info("Scraping BDA Portal for Bengaluru projects...")
         
+        local_projects = []
         try:
             url = "https://bdabangalore.org/"
-            response = self.session.get(url, timeout=15)
-            soup = BeautifulSoup(response.content, 'html.parser')
+            response = self.rate_limited_get(url)
+            soup = BeautifulSoup(response.content, 'lxml', parse_only=SECTION_STRAINER)
             
             # Look for project announcements
-            project_sections = soup.find_all(['div', 'section'], 
-                                           class_=re.compile(r'project|scheme|development|news|housing', re.I))
+            matches = PORTAL_SELECTORS['BDA'].select(soup)
+            project_sections = [node for node in matches if node.name != 'a']
             
             for section in project_sections:
-                project_data = self.extract_bda_project(section)
+                project_data = self.extract_section_project(section, 'BDA')
                 if project_data:
-                    self.projects.append(project_data)
+                    local_projects.append(project_data)
             
             # Look for specific project links
-            project_links = soup.find_all('a', href=re.compile(r'project|scheme|development|housing', re.I))
+            project_links = [node for node in matches if node.name == 'a']
+            link_jobs = []
             for link in project_links[:15]:
-                try:
-                    project_url = urljoin(url, link['href'])
-                    link_text = link.get_text(strip=True)
-                    
-                    if self.is_bengaluru_related(link_text):
-                        project_data = self.extract_project_from_url(project_url, 'BDA', link_text)
-                        if project_data:
-                            self.projects.append(project_data)
-                except Exception as e:
-                    logger.error(f"Error scraping BDA project: {e}")
-                
-                time.sleep(1)
+                link_text = link.get_text(strip=True)
+                if self.is_bengaluru_related(link_text):
+                    link_jobs.append((urljoin(url, link['href']), 'BDA', link_text))
+            local_projects.extend(self.fetch_details(self.extract_project_from_url, link_jobs, 'BDA project'))
                     
         except Exception as e:
             logger.error(f"Error scraping BDA portal: {e}")
-    
-    def extract_bda_project(self, section):
-        """Extract BDA project from section"""
-        try:
-            title = section.find(['h1', 'h2', 'h3', 'h4'])
-            if not title:
-                return None
-            
-            title_text = title.get_text(strip=True)
-            if len(title_text) < 10 or not self.is_bengaluru_related(title_text):
-                return None
-            
-            description = section.get_text(strip=True)[:500]
-            budget = self.extract_budget_from_text(description)
-            
-            return {
-                'id': f"BDA_{hash(str(section))}",
-                'projectName': title_text,
-                'description': description,
-                'budget': budget,
-                'status': random.choice(['In Progress', 'Pending', 'Completed']),
-                'location': 'Bengaluru, Karnataka',
-                'startDate': self.get_random_date(),
-                'endDate': self.get_random_future_date(),
-                'source': 'BDA',
-                'sourceUrl': 'https://bdabangalore.org/',
-                'scrapedAt': datetime.now().isoformat(),
-                'department': 'BDA',
-                'wardNumber': random.randint(1, 30),
-                'contractor': self.get_random_contractor(),
-                'geoPoint': self.get_random_bengaluru_coords()
-            }
-        except Exception as e:
-            logger.error(f"Error extracting BDA project: {e}")
-            return None
+        self.add_projects(local_projects)
     
     def scrape_bwssb_portal(self):
         """Scrape BWSSB Portal for Bengaluru projects"""
         logger.info("Scraping BWSSB Portal for Bengaluru projects...")
         
+        local_projects = []
         try:
             url = "https://bwssb.karnataka.gov.in/"
-            response = self.session.get(url, timeout=15)
-            soup = BeautifulSoup(response.content, 'html.parser')
+            response = self.rate_limited_get(url)
+            soup = BeautifulSoup(response.content, 'lxml', parse_only=SECTION_STRAINER)
             
             # Look for water supply projects
-            project_sections = soup.find_all(['div', 'section'], 
-                                           class_=re.compile(r'project|scheme|work|water|supply|sewerage', re.I))
+            matches = PORTAL_SELECTORS['BWSSB'].select(soup)
+            project_sections = [node for node in matches if node.name != 'a']
             
             for section in project_sections:
-                project_data = self.extract_bwssb_project(section)
+                project_data = self.extract_section_project(section, 'BWSSB')
                 if project_data:
-                    self.projects.append(project_data)
+                    local_projects.append(project_data)
             
             # Look for specific project links
-            project_links = soup.find_all('a', href=re.compile(r'project|scheme|work|water|supply', re.I))
+            project_links = [node for node in matches if node.name == 'a']
+            link_jobs = []
             for link in project_links[:15]:
-                try:
-                    project_url = urljoin(url, link['href'])
-                    link_text = link.get_text(strip=True)
-                    
-                    if self.is_bengaluru_related(link_text):
-                        project_data = self.extract_project_from_url(project_url, 'BWSSB', link_text)
-                        if project_data:
-                            self.projects.append(project_data)
-                except Exception as e:
-                    logger.error(f"Error scraping BWSSB project: {e}")
-                
-                time.sleep(1)
+                link_text = link.get_text(strip=True)
+                if self.is_bengaluru_related(link_text):
+                    link_jobs.append((urljoin(url, link['href']), 'BWSSB', link_text))
+            local_projects.extend(self.fetch_details(self.extract_project_from_url, link_jobs, 'BWSSB project'))
                     
         except Exception as e:
             logger.error(f"Error scraping BWSSB portal: {e}")
-    
-    def extract_bwssb_project(self, section):
-        """Extract BWSSB project from section"""
-        try:
-            title = section.find(['h1', 'h2', 'h3', 'h4'])
-            if not title:
-                return None
-            
-            title_text = title.get_text(strip=True)
-            if len(title_text) < 10 or not self.is_bengaluru_related(title_text):
-                return None
-            
-            description = section.get_text(strip=True)[:500]
-            budget = self.extract_budget_from_text(description)
-            
-            return {
-                'id': f"BWSSB_{hash(str(section))}",
-                'projectName': title_text,
-                'description': description,
-                'budget': budget,
-                'status': random.choice(['In Progress', 'Pending', 'Completed']),
-                'location': 'Bengaluru, Karnataka',
-                'startDate': self.get_random_date(),
-                'endDate': self.get_random_future_date(),
-                'source': 'BWSSB',
-                'sourceUrl': 'https://bwssb.karnataka.gov.in/',
-                'scrapedAt': datetime.now().isoformat(),
-                'department': 'BWSSB',
-                'wardNumber': random.randint(1, 30),
-                'contractor': self.get_random_contractor(),
-                'geoPoint': self.get_random_bengaluru_coords()
-            }
-        except Exception as e:
-            logger.error(f"Error extracting BWSSB project: {e}")
-            return None
+        self.add_projects(local_projects)
     
     def scrape_bmrc_portal(self):
         """Scrape BMRCL Portal for Bengaluru metro projects"""
         logger.info("Scraping BMRCL Portal for Bengaluru metro projects...")
         
+        local_projects = []
         try:
             url = "https://english.bmrc.co.in/"
-            response = self.session.get(url, timeout=15)
-            soup = BeautifulSoup(response.content, 'html.parser')
+            response = self.rate_limited_get(url)
+            soup = BeautifulSoup(response.content, 'lxml', parse_only=SECTION_STRAINER)
             
             # Look for metro project information
-            project_sections = soup.find_all(['div', 'section'], 
-                                           class_=re.compile(r'project|phase|line|station|metro|construction', re.I))
+            matches = PORTAL_SELECTORS['BMRCL'].select(soup)
+            project_sections = [node for node in matches if node.name != 'a']
             
             for section in project_sections:
-                project_data = self.extract_bmrc_project(section)
+                project_data = self.extract_section_project(section, 'BMRCL')
                 if project_data:
-                    self.projects.append(project_data)
+                    local_projects.append(project_data)
             
             # Look for specific project links
-            project_links = soup.find_all('a', href=re.compile(r'project|phase|line|station|metro', re.I))
+            project_links = [node for node in matches if node.name == 'a']
+            link_jobs = []
             for link in project_links[:15]:
-                try:
-                    project_url = urljoin(url, link['href'])
-                    link_text = link.get_text(strip=True)
-                    
-                    if self.is_bengaluru_related(link_text):
-                        project_data = self.extract_project_from_url(project_url, 'BMRCL', link_text)
-                        if project_data:
-                            self.projects.append(project_data)
-                except Exception as e:
-                    logger.error(f"Error scraping BMRCL project: {e}")
-                
-                time.sleep(1)
+                link_text = link.get_text(strip=True)
+                if self.is_bengaluru_related(link_text):
+                    link_jobs.append((urljoin(url, link['href']), 'BMRCL', link_text))
+            local_projects.extend(self.fetch_details(self.extract_project_from_url, link_jobs, 'BMRCL project'))
                     
         except Exception as e:
             logger.error(f"Error scraping BMRCL portal: {e}")
-    
-    def extract_bmrc_project(self, section):
-        """Extract BMRCL project from section"""
-        try:
-            title = section.find(['h1', 'h2', 'h3', 'h4'])
-            if not title:
-                return None
-            
-            title_text = title.get_text(strip=True)
-            if len(title_text) < 10 or not self.is_bengaluru_related(title_text):
-                return None
-            
-            description = section.get_text(strip=True)[:500]
-            budget = self.extract_budget_from_text(description)
-            
-            return {
-                'id': f"BMRCL_{hash(str(section))}",
-                'projectName': title_text,
-                'description': description,
-                'budget': budget,
-                'status': random.choice(['In Progress', 'Pending', 'Completed']),
-                'location': 'Bengaluru, Karnataka',
-                'startDate': self.get_random_date(),
-                'endDate': self.get_random_future_date(),
-                'source': 'BMRCL',
-                'sourceUrl': 'https://english.bmrc.co.in/',
-                'scrapedAt': datetime.now().isoformat(),
-                'department': 'BMRCL',
-                'wardNumber': random.randint(1, 30),
-                'contractor': self.get_random_contractor(),
-                'geoPoint': self.get_random_bengaluru_coords()
-            }
-        except Exception as e:
-            logger.error(f"Error extracting BMRCL project: {e}")
-            return None
+        self.add_projects(local_projects)
     
     def scrape_bescom_portal(self):
         """Scrape BESCOM Portal for Bengaluru electrical projects"""
         logger.info("Scraping BESCOM Portal for Bengaluru electrical projects...")
         
+        local_projects = []
         try:
             url = "https://bescom.karnataka.gov.in/"
-            response = self.session.get(url, timeout=15)
-            soup = BeautifulSoup(response.content, 'html.parser')
+            response = self.rate_limited_get(url)
+            soup = BeautifulSoup(response.content, 'lxml', parse_only=SECTION_STRAINER)
             
             # Look for electrical infrastructure projects
-            project_sections = soup.find_all(['div', 'section'], 
-                                           class_=re.compile(r'project|work|electrical|power|infrastructure|supply', re.I))
+            matches = PORTAL_SELECTORS['BESCOM'].select(soup)
+            project_sections = [node for node in matches if node.name != 'a']
             
             for section in project_sections:
-                project_data = self.extract_bescom_project(section)
+                project_data = self.extract_section_project(section, 'BESCOM')
                 if project_data:
-                    self.projects.append(project_data)
+                    local_projects.append(project_data)
             
             # Look for specific project links
-            project_links = soup.find_all('a', href=re.compile(r'project|work|electrical|power|infrastructure', re.I))
+            project_links = [node for node in matches if node.name == 'a']
+            link_jobs = []
             for link in project_links[:15]:
-                try:
-                    project_url = urljoin(url, link['href'])
-                    link_text = link.get_text(strip=True)
-                    
-                    if self.is_bengaluru_related(link_text):
-                        project_data = self.extract_project_from_url(project_url, 'BESCOM', link_text)
-                        if project_data:
-                            self.projects.append(project_data)
-                except Exception as e:
-                    logger.error(f"Error scraping BESCOM project: {e}")
-                
-                time.sleep(1)
+                link_text = link.get_text(strip=True)
+                if self.is_bengaluru_related(link_text):
+                    link_jobs.append((urljoin(url, link['href']), 'BESCOM', link_text))
+            local_projects.extend(self.fetch_details(self.extract_project_from_url, link_jobs, 'BESCOM project'))
                     
         except Exception as e:
             logger.error(f"Error scraping BESCOM portal: {e}")
-    
-    def extract_bescom_project(self, section):
-        """Extract BESCOM project from section"""
-        try:
-            title = section.find(['h1', 'h2', 'h3', 'h4'])
-            if not title:
-                return None
-            
-            title_text = title.get_text(strip=True)
-            if len(title_text) < 10 or not self.is_bengaluru_related(title_text):
-                return None
-            
-            description = section.get_text(strip=True)[:500]
-            budget = self.extract_budget_from_text(description)
-            
-            return {
-                'id': f"BESCOM_{hash(str(section))}",
-                'projectName': title_text,
-                'description': description,
-                'budget': budget,
-                'status': random.choice(['In Progress', 'Pending', 'Completed']),
-                'location': 'Bengaluru, Karnataka',
-                'startDate': self.get_random_date(),
-                'endDate': self.get_random_future_date(),
-                'source': 'BESCOM',
-                'sourceUrl': 'https://bescom.karnataka.gov.in/',
-                'scrapedAt': datetime.now().isoformat(),
-                'department': 'BESCOM',
-                'wardNumber': random.randint(1, 30),
-                'contractor': self.get_random_contractor(),
-                'geoPoint': self.get_random_bengaluru_coords()
-            }
-        except Exception as e:
-            logger.error(f"Error extracting BESCOM project: {e}")
-            return None
+        self.add_projects(local_projects)
     
     def scrape_kpwd_portal(self):
         """Scrape KPWD Portal for Bengaluru public works projects"""
         logger.info("Scraping KPWD Portal for Bengaluru public works projects...")
         
+        local_projects = []
         try:
             url = "https://kpwd.karnataka.gov.in/"
-            response = self.session.get(url, timeout=15)
-            soup = BeautifulSoup(response.content, 'html.parser')
+            response = self.rate_limited_get(url)
+            soup = BeautifulSoup(response.content, 'lxml', parse_only=SECTION_STRAINER)
             
             # Look for public works projects
-            project_sections = soup.find_all(['div', 'section'], 
-                                           class_=re.compile(r'project|work|road|bridge|building|construction|public', re.I))
+            matches = PORTAL_SELECTORS['KPWD'].select(soup)
+            project_sections = [node for node in matches if node.name != 'a']
             
             for section in project_sections:
-                project_data = self.extract_kpwd_project(section)
+                project_data = self.extract_section_project(section, 'KPWD')
                 if project_data:
-                    self.projects.append(project_data)
+                    local_projects.append(project_data)
             
             # Look for specific project links
-            project_links = soup.find_all('a', href=re.compile(r'project|work|road|bridge|building|construction', re.I))
+            project_links = [node for node in matches if node.name == 'a']
+            link_jobs = []
             for link in project_links[:15]:
-                try:
-                    project_url = urljoin(url, link['href'])
-                    link_text = link.get_text(strip=True)
-                    
-                    if self.is_bengaluru_related(link_text):
-                        project_data = self.extract_project_from_url(project_url, 'KPWD', link_text)
-                        if project_data:
-                            self.projects.append(project_data)
-                except Exception as e:
-                    logger.error(f"Error scraping KPWD project: {e}")
-                
-                time.sleep(1)
+                link_text = link.get_text(strip=True)
+                if self.is_bengaluru_related(link_text):
+                    link_jobs.append((urljoin(url, link['href']), 'KPWD', link_text))
+            local_projects.extend(self.fetch_details(self.extract_project_from_url, link_jobs, 'KPWD project'))
                     
         except Exception as e:
             logger.error(f"Error scraping KPWD portal: {e}")
-    
-    def extract_kpwd_project(self, section):
-        """Extract KPWD project from section"""
-        try:
-            title = section.find(['h1', 'h2', 'h3', 'h4'])
-            if not title:
-                return None
-            
-            title_text = title.get_text(strip=True)
-            if len(title_text) < 10 or not self.is_bengaluru_related(title_text):
-                return None
-            
-            description = section.get_text(strip=True)[:500]
-            budget = self.extract_budget_from_text(description)
-            
-            return {
-                'id': f"KPWD_{hash(str(section))}",
-                'projectName': title_text,
-                'description': description,
-                'budget': budget,
-                'status': random.choice(['In Progress', 'Pending', 'Completed']),
-                'location': 'Bengaluru, Karnataka',
-                'startDate': self.get_random_date(),
-                'endDate': self.get_random_future_date(),
-                'source': 'KPWD',
-                'sourceUrl': 'https://kpwd.karnataka.gov.in/',
-                'scrapedAt': datetime.now().isoformat(),
-                'department': 'KPWD',
-                'wardNumber': random.randint(1, 30),
-                'contractor': self.get_random_contractor(),
-                'geoPoint': self.get_random_bengaluru_coords()
-            }
-        except Exception as e:
-            logger.error(f"Error extracting KPWD project: {e}")
-            return None
+        self.add_projects(local_projects)
     
     def scrape_kuidfc_portal(self):
         """Scrape KUIDFC Portal for Bengaluru urban infrastructure projects"""
         logger.info("Scraping KUIDFC Portal for Bengaluru urban infrastructure projects...")
         
+        local_projects = []
         try:
             url = "https://kuidfc.karnataka.gov.in/"
-            response = self.session.get(url, timeout=15)
-            soup = BeautifulSoup(response.content, 'html.parser')
+            response = self.rate_limited_get(url)
+            soup = BeautifulSoup(response.content, 'lxml', parse_only=SECTION_STRAINER)
             
             # Look for urban infrastructure projects
-            project_sections = soup.find_all(['div', 'section'], 
-                                           class_=re.compile(r'project|work|infrastructure|urban|development|finance', re.I))
+            matches = PORTAL_SELECTORS['KUIDFC'].select(soup)
+            project_sections = [node for node in matches if node.name != 'a']
             
             for section in project_sections:
-                project_data = self.extract_kuidfc_project(section)
+                project_data = self.extract_section_project(section, 'KUIDFC')
                 if project_data:
-                    self.projects.append(project_data)
+                    local_projects.append(project_data)
             
             # Look for specific project links
-            project_links = soup.find_all('a', href=re.compile(r'project|work|infrastructure|urban|development', re.I))
+            project_links = [node for node in matches if node.name == 'a']
+            link_jobs = []
             for link in project_links[:15]:
-                try:
-                    project_url = urljoin(url, link['href'])
-                    link_text = link.get_text(strip=True)
-                    
-                    if self.is_bengaluru_related(link_text):
-                        project_data = self.extract_project_from_url(project_url, 'KUIDFC', link_text)
-                        if project_data:
-                            self.projects.append(project_data)
-                except Exception as e:
-                    logger.error(f"Error scraping KUIDFC project: {e}")
-                
-                time.sleep(1)
+                link_text = link.get_text(strip=True)
+                if self.is_bengaluru_related(link_text):
+                    link_jobs.append((urljoin(url, link['href']), 'KUIDFC', link_text))
+            local_projects.extend(self.fetch_details(self.extract_project_from_url, link_jobs, 'KUIDFC project'))
                     
         except Exception as e:
             logger.error(f"Error scraping KUIDFC portal: {e}")
-    
-    def extract_kuidfc_project(self, section):
-        """Extract KUIDFC project from section"""
-        try:
-            title = section.find(['h1', 'h2', 'h3', 'h4'])
-            if not title:
-                return None
-            
-            title_text = title.get_text(strip=True)
-            if len(title_text) < 10 or not self.is_bengaluru_related(title_text):
-                return None
-            
-            description = section.get_text(strip=True)[:500]
-            budget = self.extract_budget_from_text(description)
-            
-            return {
-                'id': f"KUIDFC_{hash(str(section))}",
-                'projectName': title_text,
-                'description': description,
-                'budget': budget,
-                'status': random.choice(['In Progress', 'Pending', 'Completed']),
-                'location': 'Bengaluru, Karnataka',
-                'startDate': self.get_random_date(),
-                'endDate': self.get_random_future_date(),
-                'source': 'KUIDFC',
-                'sourceUrl': 'https://kuidfc.karnataka.gov.in/',
-                'scrapedAt': datetime.now().isoformat(),
-                'department': 'KUIDFC',
-                'wardNumber': random.randint(1, 30),
-                'contractor': self.get_random_contractor(),
-                'geoPoint': self.get_random_bengaluru_coords()
-            }
-        except Exception as e:
-            logger.error(f"Error extracting KUIDFC project: {e}")
-            return None
+        self.add_projects(local_projects)
     
     def scrape_bmtc_portal(self):
         """Scrape BMTC Portal for Bengaluru transport projects"""
         logger.info("Scraping BMTC Portal for Bengaluru transport projects...")
         
+        local_projects = []
         try:
             url = "https://mybmtc.karnataka.gov.in/"
-            response = self.session.get(url, timeout=15)
-            soup = BeautifulSoup(response.content, 'html.parser')
+            response = self.rate_limited_get(url)
+            soup = BeautifulSoup(response.content, 'lxml', parse_only=SECTION_STRAINER)
             
             # Look for transport infrastructure projects
-            project_sections = soup.find_all(['div', 'section'], 
-                                           class_=re.compile(r'project|work|route|bus|terminal|transport|metro', re.I))
+            matches = PORTAL_SELECTORS['BMTC'].select(soup)
+            project_sections = [node for node in matches if node.name != 'a']
             
             for section in project_sections:
-                project_data = self.extract_bmtc_project(section)
+                project_data = self.extract_section_project(section, 'BMTC')
                 if project_data:
-                    self.projects.append(project_data)
+                    local_projects.append(project_data)
             
             # Look for specific project links
-            project_links = soup.find_all('a', href=re.compile(r'project|work|route|bus|terminal|transport', re.I))
+            project_links = [node for node in matches if node.name == 'a']
+            link_jobs = []
             for link in project_links[:15]:
-                try:
-                    project_url = urljoin(url, link['href'])
-                    link_text = link.get_text(strip=True)
-                    
-                    if self.is_bengaluru_related(link_text):
-                        project_data = self.extract_project_from_url(project_url, 'BMTC', link_text)
-                        if project_data:
-                            self.projects.append(project_data)
-                except Exception as e:
-                    logger.error(f"Error scraping BMTC project: {e}")
-                
-                time.sleep(1)
+                link_text = link.get_text(strip=True)
+                if self.is_bengaluru_related(link_text):
+                    link_jobs.append((urljoin(url, link['href']), 'BMTC', link_text))
+            local_projects.extend(self.fetch_details(self.extract_project_from_url, link_jobs, 'BMTC project'))
                     
         except Exception as e:
             logger.error(f"Error scraping BMTC portal: {e}")
+        self.add_projects(local_projects)
     
-    def extract_bmtc_project(self, section):
-        """Extract BMTC project from section"""
+    def extract_section_project(self, section, source, title_tags=('h1', 'h2', 'h3', 'h4')):
+        """Extract a project from a portal landing-page section"""
         try:
-            title = section.find(['h1', 'h2', 'h3', 'h4'])
+            title = section.find(title_tags)
             if not title:
                 return None
             
@@ -892,51 +835,56 @@ class BengaluruProjectScraper:
             budget = self.extract_budget_from_text(description)
             
             return {
-                'id': f"BMTC_{hash(str(section))}",
+                'id': section_id(source, description),
                 'projectName': title_text,
                 'description': description,
                 'budget': budget,
-                'status': random.choice(['In Progress', 'Pending', 'Completed']),
+                'status': random.choice(self.STATUSES),
                 'location': 'Bengaluru, Karnataka',
                 'startDate': self.get_random_date(),
                 'endDate': self.get_random_future_date(),
-                'source': 'BMTC',
-                'sourceUrl': 'https://mybmtc.karnataka.gov.in/',
-                'scrapedAt': datetime.now().isoformat(),
-                'department': 'BMTC',
+                'source': source,
+                'sourceUrl': self.DEPARTMENT_URLS[source],
+                'scrapedAt': self._run_started_iso,
+                'department': source,
                 'wardNumber': random.randint(1, 30),
                 'contractor': self.get_random_contractor(),
                 'geoPoint': self.get_random_bengaluru_coords()
             }
         except Exception as e:
-            logger.error(f"Error extracting BMTC project: {e}")
+            logger.error(f"Error extracting {source} project: {e}")
             return None
     
     def extract_project_from_url(self, url, source, title):
         """Extract project from a specific URL"""
         try:
-            response = self.session.get(url, timeout=15)
-            soup = BeautifulSoup(response.content, 'html.parser')
+            response = self.rate_limited_get(url)
+            # Tender links often point at PDFs or scans; don't feed those to the HTML parser
+            if not is_html(response):
+                return None
+            soup = BeautifulSoup(response.content, 'lxml')
             
             description = self.extract_description(soup)
             if not self.is_bengaluru_related(description):
                 return None
             
-            budget = self.extract_budget_from_text(soup.get_text())
-            location = self.extract_location_from_text(soup.get_text())
+            # Materialize the page text once for every text-based extractor
+            page_text = soup.get_text()
+            budget = self.extract_budget_from_text(page_text)
+            location = self.extract_location_from_text(page_text)
             
             return {
                 'id': f"{source}_{hash(url)}",
                 'projectName': title,
                 'description': description or f'Infrastructure project in {source}',
                 'budget': budget,
-                'status': random.choice(['In Progress', 'Pending', 'Completed']),
+                'status': random.choice(self.STATUSES),
                 'location': location or 'Bengaluru, Karnataka',
-                'startDate': self.extract_date(soup, 'start'),
-                'endDate': self.extract_date(soup, 'end'),
+                'startDate': self.extract_date(page_text, 'start'),
+                'endDate': self.extract_date(page_text, 'end'),
                 'source': source,
                 'sourceUrl': url,
-                'scrapedAt': datetime.now().isoformat(),
+                'scrapedAt': self._run_started_iso,
                 'department': source,
                 'wardNumber': random.randint(1, 30),
                 'contractor': self.get_random_contractor(),
@@ -978,18 +926,12 @@ class BengaluruProjectScraper:
     
     def extract_budget_from_text(self, text):
         """Extract budget from text"""
-        budget_patterns = [
-            r'₹\s*(\d+(?:,\d{3})*(?:\.\d{2})?)\s*(?:crore|crs|lakh|cr)',
-            r'Rs\.?\s*(\d+(?:,\d{3})*(?:\.\d{2})?)\s*(?:crore|crs|lakh|cr)',
-            r'(\d+(?:,\d{3})*(?:\.\d{2})?)\s*(?:crore|crs|lakh|cr)',
-            r'Budget[:\s]*₹?\s*(\d+(?:,\d{3})*(?:\.\d{2})?)'
-        ]
-        
-        for pattern in budget_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in BUDGET_RES:
+            match = pattern.search(text)
             if match:
                 amount = match.group(1).replace(',', '')
-                multiplier = 10000000 if 'crore' in text.lower() or 'cr' in text.lower() else 100000
+                # 'crore' contains 'cr', so one lowercase scan covers both
+                multiplier = 10000000 if 'cr' in text.lower() else 100000
                 return int(float(amount) * multiplier)
         
         # Return random budget if not found
@@ -997,79 +939,38 @@ class BengaluruProjectScraper:
     
     def extract_location_from_text(self, text):
         """Extract location from text"""
-        location_patterns = [
-            r'Location[:\s]*([^,\n]+)',
-            r'Area[:\s]*([^,\n]+)',
-            r'Address[:\s]*([^,\n]+)',
-            r'([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\s+(?:Ward|Area|Zone)'
-        ]
-        
-        for pattern in location_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in LOCATION_RES:
+            match = pattern.search(text)
             if match:
                 return match.group(1).strip()
         
         return 'Bengaluru, Karnataka'
     
-    def extract_date(self, soup, date_type):
-        """Extract start or end date"""
-        text = soup.get_text()
-        
-        date_patterns = [
-            rf'{date_type.title()}[:\s]*(\d{{1,2}}[/-]\d{{1,2}}[/-]\d{{4}})',
-            rf'{date_type.title()}[:\s]*(\d{{4}}[/-]\d{{1,2}}[/-]\d{{1,2}})',
-            rf'{date_type.title()}[:\s]*(\w+\s+\d{{1,2}},?\s+\d{{4}})'
-        ]
-        
-        for pattern in date_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
+    def extract_date(self, text, date_type):
+        """Extract start or end date from page text"""
+        for match in DATE_RES[date_type].finditer(text):
+            kind = match.lastgroup
+            for fmt in DATE_FORMATS[kind]:
                 try:
-                    date_str = match.group(1)
-                    for fmt in ['%d/%m/%Y', '%Y/%m/%d', '%d-%m-%Y', '%Y-%m-%d', '%B %d, %Y']:
-                        try:
-                            return datetime.strptime(date_str, fmt).isoformat()
-                        except ValueError:
-                            continue
-                except:
+                    return datetime.strptime(match.group(kind), fmt).isoformat()
+                except ValueError:
                     continue
         
         return self.get_random_date() if date_type == 'start' else self.get_random_future_date()
     
     def get_random_date(self):
         """Get random date in the past"""
-        start_date = datetime.now() - timedelta(days=365)
-        end_date = datetime.now() - timedelta(days=30)
-        random_date = start_date + timedelta(days=random.randint(0, (end_date - start_date).days))
-        return random_date.isoformat()
+        # Between 365 and 30 days before the run started
+        return (self._past_date_start + timedelta(days=random.randint(0, 335))).isoformat()
     
     def get_random_future_date(self):
         """Get random date in the future"""
-        start_date = datetime.now() + timedelta(days=30)
-        end_date = datetime.now() + timedelta(days=365)
-        random_date = start_date + timedelta(days=random.randint(0, (end_date - start_date).days))
-        return random_date.isoformat()
+        # Between 30 and 365 days after the run started
+        return (self._future_date_start + timedelta(days=random.randint(0, 335))).isoformat()
     
     def get_random_contractor(self):
         """Get random contractor name"""
-        contractors = [
-            'ABC Construction Ltd.',
-            'XYZ Builders',
-            'Infrastructure Solutions Inc.',
-            'Metro Construction Co.',
-            'Water Works Ltd.',
-            'Power Solutions Inc.',
-            'Bridge Builders Ltd.',
-            'Urban Development Corp.',
-            'Transport Infrastructure Ltd.',
-            'Public Works Contractors',
-            'Bengaluru Infrastructure Ltd.',
-            'Karnataka Development Corp.',
-            'City Builders Pvt Ltd.',
-            'Metro Rail Contractors',
-            'Water Supply Engineers'
-        ]
-        return random.choice(contractors)
+        return random.choice(self.CONTRACTORS)
     
     def get_random_bengaluru_coords(self):
         """Get random coordinates within Bengaluru"""
@@ -1086,295 +987,48 @@ class BengaluruProjectScraper:
         """Generate comprehensive mock projects for all departments"""
         logger.info("Generating comprehensive mock Bengaluru projects...")
         
-        # BDA Projects
-        bda_projects = [
-            {
-                'id': f"BDA_MOCK_{len(self.projects) + 1}",
-                'projectName': 'BDA Namma Metro Housing Scheme Phase 2',
-                'description': 'Affordable housing project near metro stations with modern amenities and connectivity',
-                'budget': 85000000,
-                'status': 'In Progress',
-                'location': 'Bengaluru, Karnataka',
-                'startDate': self.get_random_date(),
-                'endDate': self.get_random_future_date(),
-                'source': 'BDA',
-                'sourceUrl': 'https://bdabangalore.org/',
-                'scrapedAt': datetime.now().isoformat(),
-                'department': 'BDA',
-                'wardNumber': random.randint(1, 30),
-                'contractor': self.get_random_contractor(),
-                'geoPoint': self.get_random_bengaluru_coords()
-            },
-            {
-                'id': f"BDA_MOCK_{len(self.projects) + 2}",
-                'projectName': 'BDA Commercial Complex Development',
-                'description': 'Development of integrated commercial complex with retail, office, and parking facilities',
-                'budget': 120000000,
-                'status': 'Pending',
-                'location': 'Bengaluru, Karnataka',
-                'startDate': self.get_random_date(),
-                'endDate': self.get_random_future_date(),
-                'source': 'BDA',
-                'sourceUrl': 'https://bdabangalore.org/',
-                'scrapedAt': datetime.now().isoformat(),
-                'department': 'BDA',
-                'wardNumber': random.randint(1, 30),
-                'contractor': self.get_random_contractor(),
-                'geoPoint': self.get_random_bengaluru_coords()
-            }
-        ]
-        
-        # BWSSB Projects
-        bwssb_projects = [
-            {
-                'id': f"BWSSB_MOCK_{len(self.projects) + 3}",
-                'projectName': 'BWSSB Cauvery Water Supply Phase 5',
-                'description': 'Extension of Cauvery water supply network to new areas with treatment plants',
-                'budget': 65000000,
-                'status': 'In Progress',
-                'location': 'Bengaluru, Karnataka',
-                'startDate': self.get_random_date(),
-                'endDate': self.get_random_future_date(),
-                'source': 'BWSSB',
-                'sourceUrl': 'https://bwssb.karnataka.gov.in/',
-                'scrapedAt': datetime.now().isoformat(),
-                'department': 'BWSSB',
-                'wardNumber': random.randint(1, 30),
-                'contractor': self.get_random_contractor(),
-                'geoPoint': self.get_random_bengaluru_coords()
-            },
-            {
-                'id': f"BWSSB_MOCK_{len(self.projects) + 4}",
-                'projectName': 'BWSSB Sewerage Treatment Plant Upgrade',
-                'description': 'Modernization of existing sewerage treatment plants with advanced technology',
-                'budget': 40000000,
-                'status': 'Pending',
-                'location': 'Bengaluru, Karnataka',
-                'startDate': self.get_random_date(),
-                'endDate': self.get_random_future_date(),
-                'source': 'BWSSB',
-                'sourceUrl': 'https://bwssb.karnataka.gov.in/',
-                'scrapedAt': datetime.now().isoformat(),
-                'department': 'BWSSB',
-                'wardNumber': random.randint(1, 30),
-                'contractor': self.get_random_contractor(),
-                'geoPoint': self.get_random_bengaluru_coords()
-            }
-        ]
-        
-        # BMRCL Projects
-        bmrcl_projects = [
-            {
-                'id': f"BMRCL_MOCK_{len(self.projects) + 5}",
-                'projectName': 'BMRCL Purple Line Extension Phase 2',
-                'description': 'Extension of purple line metro from Whitefield to Electronic City with 8 new stations',
-                'budget': 250000000,
-                'status': 'In Progress',
-                'location': 'Bengaluru, Karnataka',
-                'startDate': self.get_random_date(),
-                'endDate': self.get_random_future_date(),
-                'source': 'BMRCL',
-                'sourceUrl': 'https://english.bmrc.co.in/',
-                'scrapedAt': datetime.now().isoformat(),
-                'department': 'BMRCL',
-                'wardNumber': random.randint(1, 30),
-                'contractor': self.get_random_contractor(),
-                'geoPoint': self.get_random_bengaluru_coords()
-            },
-            {
-                'id': f"BMRCL_MOCK_{len(self.projects) + 6}",
-                'projectName': 'BMRCL Airport Metro Line',
-                'description': 'Direct metro connectivity from city center to Kempegowda International Airport',
-                'budget': 180000000,
-                'status': 'Pending',
-                'location': 'Bengaluru, Karnataka',
-                'startDate': self.get_random_date(),
-                'endDate': self.get_random_future_date(),
-                'source': 'BMRCL',
-                'sourceUrl': 'https://english.bmrc.co.in/',
-                'scrapedAt': datetime.now().isoformat(),
-                'department': 'BMRCL',
-                'wardNumber': random.randint(1, 30),
-                'contractor': self.get_random_contractor(),
-                'geoPoint': self.get_random_bengaluru_coords()
-            }
-        ]
-        
-        # BESCOM Projects
-        bescom_projects = [
-            {
-                'id': f"BESCOM_MOCK_{len(self.projects) + 7}",
-                'projectName': 'BESCOM Smart Grid Implementation',
-                'description': 'Implementation of smart grid technology for efficient power distribution and monitoring',
-                'budget': 75000000,
-                'status': 'In Progress',
-                'location': 'Bengaluru, Karnataka',
-                'startDate': self.get_random_date(),
-                'endDate': self.get_random_future_date(),
-                'source': 'BESCOM',
-                'sourceUrl': 'https://bescom.karnataka.gov.in/',
-                'scrapedAt': datetime.now().isoformat(),
-                'department': 'BESCOM',
-                'wardNumber': random.randint(1, 30),
-                'contractor': self.get_random_contractor(),
-                'geoPoint': self.get_random_bengaluru_coords()
-            },
-            {
-                'id': f"BESCOM_MOCK_{len(self.projects) + 8}",
-                'projectName': 'BESCOM Solar Power Integration',
-                'description': 'Integration of solar power systems in government buildings and public facilities',
-                'budget': 35000000,
-                'status': 'Pending',
-                'location': 'Bengaluru, Karnataka',
-                'startDate': self.get_random_date(),
-                'endDate': self.get_random_future_date(),
-                'source': 'BESCOM',
-                'sourceUrl': 'https://bescom.karnataka.gov.in/',
-                'scrapedAt': datetime.now().isoformat(),
-                'department': 'BESCOM',
-                'wardNumber': random.randint(1, 30),
-                'contractor': self.get_random_contractor(),
-                'geoPoint': self.get_random_bengaluru_coords()
-            }
-        ]
+        self.add_projects([{
+            'id': f"{department}_MOCK_{next(self._mock_ids[department])}",
+            'projectName': name,
+            'description': description,
+            'budget': budget,
+            'status': status,
+            'location': 'Bengaluru, Karnataka',
+            'startDate': self.get_random_date(),
+            'endDate': self.get_random_future_date(),
+            'source': department,
+            'sourceUrl': self.DEPARTMENT_URLS[department],
+            'scrapedAt': self._run_started_iso,
+            'department': department,
+            'wardNumber': random.randint(1, 30),
+            'contractor': self.get_random_contractor(),
+            'geoPoint': self.get_random_bengaluru_coords()
+        } for department, name, description, budget, status in self.DEPARTMENT_MOCK_TEMPLATES])
         
-        # KPWD Projects
-        kpwd_projects = [
-            {
-                'id': f"KPWD_MOCK_{len(self.projects) + 9}",
-                'projectName': 'KPWD Outer Ring Road Phase 3',
-                'description': 'Construction of third phase of outer ring road with flyovers and underpasses',
-                'budget': 150000000,
-                'status': 'In Progress',
-                'location': 'Bengaluru, Karnataka',
-                'startDate': self.get_random_date(),
-                'endDate': self.get_random_future_date(),
-                'source': 'KPWD',
-                'sourceUrl': 'https://kpwd.karnataka.gov.in/',
-                'scrapedAt': datetime.now().isoformat(),
-                'department': 'KPWD',
-                'wardNumber': random.randint(1, 30),
-                'contractor': self.get_random_contractor(),
-                'geoPoint': self.get_random_bengaluru_coords()
-            },
-            {
-                'id': f"KPWD_MOCK_{len(self.projects) + 10}",
-                'projectName': 'KPWD Multi-Level Parking Complex',
-                'description': 'Construction of automated multi-level parking complexes in commercial areas',
-                'budget': 60000000,
-                'status': 'Pending',
-                'location': 'Bengaluru, Karnataka',
-                'startDate': self.get_random_date(),
-                'endDate': self.get_random_future_date(),
-                'source': 'KPWD',
-                'sourceUrl': 'https://kpwd.karnataka.gov.in/',
-                'scrapedAt': datetime.now().isoformat(),
-                'department': 'KPWD',
-                'wardNumber': random.randint(1, 30),
-                'contractor': self.get_random_contractor(),
-                'geoPoint': self.get_random_bengaluru_coords()
-            }
-        ]
-        
-        # KUIDFC Projects
-        kuidfc_projects = [
-            {
-                'id': f"KUIDFC_MOCK_{len(self.projects) + 11}",
-                'projectName': 'KUIDFC Smart City Infrastructure',
-                'description': 'Development of smart city infrastructure including IoT sensors and data centers',
-                'budget': 200000000,
-                'status': 'In Progress',
-                'location': 'Bengaluru, Karnataka',
-                'startDate': self.get_random_date(),
-                'endDate': self.get_random_future_date(),
-                'source': 'KUIDFC',
-                'sourceUrl': 'https://kuidfc.karnataka.gov.in/',
-                'scrapedAt': datetime.now().isoformat(),
-                'department': 'KUIDFC',
-                'wardNumber': random.randint(1, 30),
-                'contractor': self.get_random_contractor(),
-                'geoPoint': self.get_random_bengaluru_coords()
-            },
-            {
-                'id': f"KUIDFC_MOCK_{len(self.projects) + 12}",
-                'projectName': 'KUIDFC Urban Mobility Hub',
-                'description': 'Development of integrated urban mobility hub with bus, metro, and taxi connectivity',
-                'budget': 90000000,
-                'status': 'Pending',
-                'location': 'Bengaluru, Karnataka',
-                'startDate': self.get_random_date(),
-                'endDate': self.get_random_future_date(),
-                'source': 'KUIDFC',
-                'sourceUrl': 'https://kuidfc.karnataka.gov.in/',
-                'scrapedAt': datetime.now().isoformat(),
-                'department': 'KUIDFC',
-                'wardNumber': random.randint(1, 30),
-                'contractor': self.get_random_contractor(),
-                'geoPoint': self.get_random_bengaluru_coords()
-            }
-        ]
-        
-        # BMTC Projects
-        bmtc_projects = [
-            {
-                'id': f"BMTC_MOCK_{len(self.projects) + 13}",
-                'projectName': 'BMTC Electric Bus Fleet Expansion',
-                'description': 'Introduction of 500 electric buses for eco-friendly public transportation',
-                'budget': 80000000,
-                'status': 'In Progress',
-                'location': 'Bengaluru, Karnataka',
-                'startDate': self.get_random_date(),
-                'endDate': self.get_random_future_date(),
-                'source': 'BMTC',
-                'sourceUrl': 'https://mybmtc.karnataka.gov.in/',
-                'scrapedAt': datetime.now().isoformat(),
-                'department': 'BMTC',
-                'wardNumber': random.randint(1, 30),
-                'contractor': self.get_random_contractor(),
-                'geoPoint': self.get_random_bengaluru_coords()
-            },
-            {
-                'id': f"BMTC_MOCK_{len(self.projects) + 14}",
-                'projectName': 'BMTC Bus Terminal Modernization',
-                'description': 'Modernization of major bus terminals with digital displays and amenities',
-                'budget': 25000000,
-                'status': 'Pending',
-                'location': 'Bengaluru, Karnataka',
-                'startDate': self.get_random_date(),
-                'endDate': self.get_random_future_date(),
-                'source': 'BMTC',
-                'sourceUrl': 'https://mybmtc.karnataka.gov.in/',
-                'scrapedAt': datetime.now().isoformat(),
-                'department': 'BMTC',
-                'wardNumber': random.randint(1, 30),
-                'contractor': self.get_random_contractor(),
-                'geoPoint': self.get_random_bengaluru_coords()
-            }
-        ]
-        
-        # Add all projects
-        all_mock_projects = (bda_projects + bwssb_projects + bmrcl_projects + 
-                           bescom_projects + kpwd_projects + kuidfc_projects + bmtc_projects)
-        
-        for project in all_mock_projects:
-            self.projects.append(project)
-        
-        logger.info(f"Generated {len(all_mock_projects)} additional mock projects")
+        logger.info(f"Generated {len(self.DEPARTMENT_MOCK_TEMPLATES)} additional mock projects")
 
     def scrape_all_portals(self):
         """Scrape all government portals for Bengaluru projects"""
         logger.info("Starting comprehensive Bengaluru project scraping...")
         
-        # Scrape all portals
-        self.scrape_eproc_portal()
-        self.scrape_bbmp_portal()
-        self.scrape_bda_portal()
-        self.scrape_bwssb_portal()
-        self.scrape_bmrc_portal()
-        self.scrape_bescom_portal()
-        self.scrape_kpwd_portal()
-        self.scrape_kuidfc_portal()
-        self.scrape_bmtc_portal()
+        # Scrape all portals concurrently; each targets a different host and
+        # spends nearly all its time waiting on the network. Each portal's
+        # projects are collected separately and merged in the order below,
+        # so the output does not depend on which portal finished first.
+        portals = [
+            self.scrape_eproc_portal,
+            self.scrape_bbmp_portal,
+            self.scrape_bda_portal,
+            self.scrape_bwssb_portal,
+            self.scrape_bmrc_portal,
+            self.scrape_bescom_portal,
+            self.scrape_kpwd_portal,
+            self.scrape_kuidfc_portal,
+            self.scrape_bmtc_portal
+        ]
+        with ThreadPoolExecutor(max_workers=len(portals)) as executor:
+            for portal_projects in executor.map(self.collect_portal, portals):
+                self.add_projects(portal_projects)
         
         # Generate comprehensive mock projects
         self.generate_comprehensive_mock_projects()
@@ -1385,20 +1039,28 @@ class BengaluruProjectScraper:
     def save_to_json(self, projects, filename='bengaluru_projects.json'):
         """Save projects to JSON file"""
         try:
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(projects, f, indent=2, ensure_ascii=False)
+            with open(filename, 'wb') as f:
+                f.write(_dumps_pretty(projects))
             logger.info(f"Saved {len(projects)} Bengaluru projects to {filename}")
         except Exception as e:
             logger.error(f"Error saving to JSON: {e}")
     
     def close(self):
-        """Close selenium driver"""
-        if self.driver:
-            self.driver.quit()
+        """Close selenium driver, if one was ever started"""
+        if self._driver:
+            self._driver.quit()
+            self._driver = None
 
-def main():
+def main(argv=None):
     """Main function to run the scraper"""
-    scraper = BengaluruProjectScraper()
+    parser = argparse.ArgumentParser(description="Scrape Bengaluru projects from government portals")
+    parser.add_argument(
+        '--force-rescrape', action='store_true',
+        help="refetch every page instead of reusing the on-disk HTTP cache"
+    )
+    args = parser.parse_args(argv)
+    
+    scraper = BengaluruProjectScraper(force_rescrape=args.force_rescrape)
     
     try:
         # Scrape all portals
@@ -1411,28 +1073,19 @@ def main():
         print(f"\n=== Bengaluru Project Scraping Summary ===")
         print(f"Total Bengaluru projects found: {len(projects)}")
         
-        # Group by source
-        sources = {}
-        for project in projects:
-            source = project.get('source', 'Unknown')
-            sources[source] = sources.get(source, 0) + 1
+        # Group by source and status, and total the budget
+        sources = Counter(project.get('source', 'Unknown') for project in projects)
+        statuses = Counter(project.get('status', 'Unknown') for project in projects)
+        total_budget = sum(project.get('budget', 0) for project in projects)
         
         print("\nBengaluru projects by source:")
         for source, count in sources.items():
             print(f"  {source}: {count}")
         
-        # Group by status
-        statuses = {}
-        for project in projects:
-            status = project.get('status', 'Unknown')
-            statuses[status] = statuses.get(status, 0) + 1
-        
         print("\nBengaluru projects by status:")
         for status, count in statuses.items():
             print(f"  {status}: {count}")
         
-        # Total budget
-        total_budget = sum(project.get('budget', 0) for project in projects)
         print(f"\nTotal budget for Bengaluru projects: ₹{total_budget:,.0f}")
         print(f"Average budget per project: ₹{total_budget/len(projects):,.0f}")
         
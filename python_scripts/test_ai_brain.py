@@ -0,0 +1,54 @@
+import unittest
+import logging
+import sys
+import os
+
+import pandas as pd
+
+# Add the current directory to Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from ai_brain import AIBrain
+
+class TestBudgetAnomalies(unittest.TestCase):
+    def setUp(self):
+        # The detectors only need a logger; skip the Firestore client
+        self.brain = AIBrain.__new__(AIBrain)
+        self.brain.logger = logging.getLogger(__name__)
+
+    def make_projects(self, rows):
+        return pd.DataFrame({
+            'id': [f"P{i}" for i in range(len(rows))],
+            'department': pd.Series([department for department, _ in rows], dtype='category'),
+            'budget': [budget for _, budget in rows],
+            'startDate': None,
+            'endDate': None,
+            'actualCompletionDate': None,
+            'contractorName': None,
+            'projectName': None
+        })
+
+    def test_department_with_only_zero_budgets(self):
+        # BDA sorts between the other two departments and has no usable budgets
+        rows = [('BBMP', 100)] * 9 + [('BBMP', 1000)]
+        rows += [('BDA', 0)] * 3
+        rows += [('BWSSB', 50)] * 3
+        anomalies = self.brain.detect_budget_anomalies(self.make_projects(rows))
+
+        self.assertEqual(len(anomalies), 1)
+        self.assertEqual(anomalies[0]['linkedProjectIds'], ['P9'])
+        self.assertIn('BBMP', anomalies[0]['description'])
+        self.assertIn('avg: ₹190', anomalies[0]['description'])
+
+    def test_zero_budget_department_sorting_first(self):
+        # A missing department ahead of the others must not shift their stats
+        rows = [('BBMP', 0)] * 3
+        rows += [('BDA', 100)] * 9 + [('BDA', 1000)]
+        anomalies = self.brain.detect_budget_anomalies(self.make_projects(rows))
+
+        self.assertEqual(len(anomalies), 1)
+        self.assertEqual(anomalies[0]['linkedProjectIds'], ['P12'])
+        self.assertIn('BDA', anomalies[0]['description'])
+
+if __name__ == '__main__':
+    unittest.main()